@@ -1,7 +1,12 @@
 #!/usr/bin/env python
 
 import hashlib
-from typing import Dict, List, Optional
+import re
+from typing import Dict, List, Optional, Tuple
+
+# Precompiled patterns for runs of 3 and 5 identical characters
+TRIPLET = re.compile(r"(.)\1\1")
+QUINTUPLET = re.compile(r"(.)\1{4}")
 
 
 def generate_hash(salt: str, index: int, stretch: int = 0, cache: Optional[Dict[int, str]] = None) -> str:
@@ -55,36 +60,36 @@ def find_triplet(hash_str: str) -> Optional[str]:
                        triplet is found.
 
     Description:
-        This function scans the hash string for the first occurrence of three
-        identical consecutive characters. If found, it returns the character;
-        otherwise, it returns None.
+        This function searches the hash string for the first occurrence of
+        three identical consecutive characters using a precompiled regex. If
+        found, it returns the character; otherwise, it returns None.
     """
 
-    for i in range(len(hash_str) - 2):
-        if hash_str[i] == hash_str[i + 1] == hash_str[i + 2]:
-            return hash_str[i]
-    return None
+    match = TRIPLET.search(hash_str)
+    return match.group(1) if match else None
 
 
-def has_quintuplet(hash_str: str, char: str) -> bool:
+def quintuplet_mask(hash_str: str) -> int:
     """
-    Checks if the hash contains a quintuplet (five of the same character in a
-    row) for the given character.
+    Packs the quintuplets (five of the same character in a row) of a hash
+    into a 16-bit mask.
 
     Args:
-        hash_str (str): The hash string to search for a quintuplet.
-        char (str): The character to check for a quintuplet.
+        hash_str (str): The hash string to search for quintuplets.
 
     Returns:
-        bool: True if the hash contains a quintuplet of the given character,
-              otherwise False.
+        int: A mask with bit n set when hex digit n forms a quintuplet.
 
     Description:
-        This function checks if the hash string contains five consecutive
-        occurrences of the specified character.
+        This function extracts all quintuplet characters in a single regex
+        pass, so each hash only needs to be scanned once no matter how many
+        earlier triplets look it up.
     """
 
-    return char * 5 in hash_str
+    mask = 0
+    for char in QUINTUPLET.findall(hash_str):
+        mask |= 1 << int(char, 16)
+    return mask
 
 
 def find_keys(salt: str, stretch: int = 0) -> int:
@@ -109,32 +114,50 @@ def find_keys(salt: str, stretch: int = 0) -> int:
         4. If a quintuplet is found, the index is added to the list of keys.
         5. The process continues until 64 keys are found.
 
-        A cache is used to store computed hashes, avoiding redundant
-        computations and improving performance.
+        The current hash and the next 1000 live in a ring buffer of
+        (triplet digit, quintuplet mask) pairs, alongside a count per hex
+        digit of how many of the next 1000 masks have that bit set. Moving
+        to the next index swaps one mask out and one in, and checking a
+        triplet is a single counter lookup, so every hash is generated and
+        scanned exactly once.
     """
 
+    def scan(index: int) -> Tuple[int, int]:
+        hash_str = generate_hash(salt, index, stretch)
+        triplet_char = find_triplet(hash_str)
+        triplet = int(triplet_char, 16) if triplet_char else -1
+        return triplet, quintuplet_mask(hash_str)
+
+    def count_mask(mask: int, delta: int) -> None:
+        while mask:
+            low = mask & -mask
+            quint_counts[low.bit_length() - 1] += delta
+            mask ^= low
+
     keys: List[int] = []  # List to store the indices of valid keys
     index = 0  # Current index being checked
-    has_cache: Dict[int, str] = {}  # Cache to store computed hashes
 
-    while len(keys) < 64:
-        # Generate the hash for the current index, using the cache to avoid
-        # recomputation
-        hash_str = generate_hash(salt, index, stretch, has_cache)
+    # Slot i % 1001 holds the scan for index i: the current index plus the
+    # 1000 after it
+    ring = [scan(i) for i in range(1001)]
+    quint_counts = [0] * 16  # Quintuplets per hex digit in the next 1000
+    for _, mask in ring[1:]:
+        count_mask(mask, 1)
 
-        # Check if the hash contains a triplet
-        triplet_char = find_triplet(hash_str)
-        if triplet_char:
-            # If a triplet is found, check the next 1000 hashes for a
-            # quintuplet of the same character
-            for i in range(1, 1001):
-                next_hash = generate_hash(salt, index + i, stretch, has_cache)
-                if has_quintuplet(next_hash, triplet_char):
-                    # If a quintuplet is found, add the index to list of keys
-                    keys.append(index)
-                    break
-
-        # Move to the next index
+    while len(keys) < 64:
+        slot = index % 1001
+        triplet, _ = ring[slot]
+
+        # If a triplet is found, check the next 1000 hashes for a
+        # quintuplet of the same character
+        if triplet >= 0 and quint_counts[triplet]:
+            keys.append(index)
+
+        # Slide the window forward: index + 1 leaves the lookahead to become
+        # current and index + 1001 replaces this slot
+        count_mask(ring[(index + 1) % 1001][1], -1)
+        ring[slot] = scan(index + 1001)
+        count_mask(ring[slot][1], 1)
         index += 1
 
     return keys[63]
@@ -11,8 +11,15 @@ The algorithm works by repeatedly expanding the input data using a modified
 dragon curve pattern and then computing a checksum on the expanded data.
 This is commonly used in scenarios where data needs to be expanded in a
 deterministic way while maintaining certain mathematical properties.
+
+The puzzle answers are computed by dragon_checksum, which fuses the two
+steps and never builds the expanded data. expand_data and compute_checksum
+are the direct implementations of each step.
 """
 
+from itertools import accumulate
+from operator import xor
+
 
 def expand_data(initial_state: str, length: int) -> str:
     """
@@ -104,6 +111,91 @@ def compute_checksum(data: str) -> str:
     return checksum
 
 
+def count_joiner_ones(count: int) -> int:
+    """
+    Counts the '1' joiner bits among the first `count` joiners of the
+    expanded data.
+
+    The expanded data is always blocks of the initial state (A) and its
+    reversed, flipped copy (B), alternating A, B, A, B, ..., with one joiner
+    bit after each block. The joiners follow the regular paperfolding
+    sequence: joiner n (1-based) is '1' exactly when the odd part of n is
+    3 mod 4.
+
+    Args:
+        count (int): How many leading joiners to count
+
+    Returns:
+        int: The number of joiners among them that are '1'
+
+    Examples:
+        >>> count_joiner_ones(7)  # joiners 0, 0, 1, 0, 0, 1, 1
+        3
+    """
+
+    ones = 0
+    while count:
+        # Odd numbers <= count that are 3 mod 4, then repeat for count / 2
+        ones += (count + 1) // 4
+        count >>= 1
+    return ones
+
+
+def dragon_checksum(initial_state: str, length: int) -> str:
+    """
+    Computes the checksum of the expanded data without building the expanded
+    data itself.
+
+    Writing length = odd * 2**k, each checksum character covers a run of 2**k
+    expanded bits and equals 1 XOR the parity of that run (or just the bit
+    itself when k = 0). The parity of any prefix of the expanded data follows
+    from its block structure: whole A and B blocks, the joiners between them
+    (see count_joiner_ones) and a partial final block. Each checksum
+    character therefore takes O(log length) work, and memory stays at the
+    size of the initial state and the checksum.
+
+    Args:
+        initial_state (str): Starting string (containing only '0' and '1')
+        length (int): The length the data would be expanded to
+
+    Returns:
+        str: The same checksum as compute_checksum(expand_data(...))
+
+    Examples:
+        >>> dragon_checksum('10000', 20)
+        '01100'
+    """
+
+    a_bits = [int(bit) for bit in initial_state]
+    b_bits = [1 - bit for bit in reversed(a_bits)]
+
+    # Prefix parities of each block, so a partial block is one lookup
+    a_prefix = list(accumulate(a_bits, xor, initial=0))
+    b_prefix = list(accumulate(b_bits, xor, initial=0))
+    block_size = len(a_bits) + 1  # A block (or B block) plus its joiner
+
+    def prefix_parity(n: int) -> int:
+        blocks, rest = divmod(n, block_size)
+        # Whole blocks alternate A, B, A, ... and each adds one joiner
+        parity = a_prefix[-1] & ((blocks + 1) // 2)
+        parity ^= b_prefix[-1] & (blocks // 2)
+        parity ^= count_joiner_ones(blocks) & 1
+        # Partial block that follows them
+        parity ^= (b_prefix if blocks & 1 else a_prefix)[rest]
+        return parity
+
+    chunk = length & -length  # Largest power of two dividing length
+    flip = 1 if chunk > 1 else 0
+
+    checksum = []
+    previous = 0
+    for end in range(chunk, length + 1, chunk):
+        current = prefix_parity(end)
+        checksum.append(str(previous ^ current ^ flip))
+        previous = current
+    return ''.join(checksum)
+
+
 def part_one() -> str:
     """
     Solves part one of the dragon curve challenge by expanding the initial
@@ -117,7 +209,7 @@ def part_one() -> str:
         before computing the checksum.
     """
 
-    return compute_checksum(expand_data('10111100110001111', 272))
+    return dragon_checksum('10111100110001111', 272)
 
 
 def part_two() -> str:
@@ -129,12 +221,12 @@ def part_two() -> str:
         str: The computed checksum for the expanded data
 
     Note:
-        The initial state '10111100110001111' is expanded to length 35651584
-        before computing the checksum. This is a significantly larger expansion
-        than part one and may take longer to compute.
+        The initial state '10111100110001111' is notionally expanded to
+        length 35651584, but dragon_checksum never materializes that data,
+        so this is as cheap as part one.
     """
 
-    return compute_checksum(expand_data('10111100110001111', 35651584))
+    return dragon_checksum('10111100110001111', 35651584)
 
 
 if __name__ == "__main__":
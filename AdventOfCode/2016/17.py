@@ -4,14 +4,14 @@ import hashlib
 from collections import deque
 
 
-def get_moves(passcode, path, x, y):
+def get_moves(state, x, y):
     """
     Determines the possible moves from the current position based on the
-    passcode and path.
+    hash of the passcode and path.
 
     Args:
-        passcode (str): The initial passcode provided in the puzzle.
-        path (str): The sequence of moves taken so far (e.g., "UDLR").
+        state (hashlib._Hash): An MD5 object that has already been fed the
+                               passcode followed by the moves taken so far.
         x (int): The current x-coordinate in the grid.
         y (int): The current y-coordinate in the grid.
 
@@ -22,9 +22,8 @@ def get_moves(passcode, path, x, y):
               - The new y-coordinate after the move.
     """
 
-    # Compute the MD5 hash of the passcode concatenated with the current path
-    hash_input = passcode + path
-    hash_result = hashlib.md5(hash_input.encode()).hexdigest()[:4]
+    # The MD5 state already covers passcode + path, so just finish the digest
+    hash_result = state.hexdigest()[:4]
 
     moves = []
     # Check each of the first four characters of hash to determine valid moves
@@ -43,12 +42,37 @@ def get_moves(passcode, path, x, y):
     return moves
 
 
+def build_path(nodes, node):
+    """
+    Rebuilds a path by following parent pointers back to the start.
+
+    Args:
+        nodes (list): List of (parent_index, move) tuples, one per BFS node.
+        node (int): Index of the node whose path should be rebuilt.
+
+    Returns:
+        str: The sequence of moves from the start to the node.
+    """
+
+    moves = []
+    while node > 0:
+        node, move = nodes[node]
+        moves.append(move)
+    return ''.join(reversed(moves))
+
+
 def find_paths(passcode):
     """
     Finds the shortest and longest paths from the top-left corner (0, 0) to
     the bottom-right corner (3, 3) of a 4x4 grid, using a Breadth-First
     Search (BFS) approach.
 
+    Paths are never stored as strings while searching. Each node records
+    only its parent and the move that reached it, and carries a copy of the
+    MD5 state for its path so the next hash costs one byte of input rather
+    than rehashing the whole path. The shortest path is rebuilt from the
+    parent pointers once the search is done.
+
     Args:
         passcode (str): The initial passcode provided in the puzzle.
 
@@ -58,31 +82,43 @@ def find_paths(passcode):
                - The length of the longest path as an integer.
     """
 
+    nodes = [(-1, '')]  # (parent_index, move) for every node, root first
+
     # Initialize a queue for BFS, starting at position (0, 0) w/ an empty path
     queue = deque()
-    queue.append(('', 0, 0))  # (path, x, y)
+    queue.append((0, hashlib.md5(passcode.encode()), 0, 0, 0))
+    # (node_index, md5_state, x, y, depth)
 
-    shortest_path = None     # Stores the shortest path to the target
+    shortest_node = None     # Node index of the shortest path to the target
     longest_path_length = 0  # Stores the length of longest path to the target
 
     while queue:
-        # Dequeue the next path and position to explore
-        path, x, y = queue.popleft()
+        # Dequeue the next node and position to explore
+        node, state, x, y, depth = queue.popleft()
 
         # Check if the current position is the target (3, 3)
         if x == 3 and y == 3:
-            # If this is the first time reaching the target, store it as the
-            # shortest path
-            if not shortest_path:
-                shortest_path = path
+            # If this is the first time reaching the target, remember it as
+            # the shortest path
+            if shortest_node is None:
+                shortest_node = node
             # Update the longest path length if this path is longer
-            longest_path_length = max(longest_path_length, len(path))
+            longest_path_length = max(longest_path_length, depth)
             continue  # Skip further exploration from this position
 
         # Explore all valid moves from the current position
-        for move, new_x, new_y in get_moves(passcode, path, x, y):
-            # Enqueue the new path and position
-            queue.append((path + move, new_x, new_y))
+        for move, new_x, new_y in get_moves(state, x, y):
+            # Extend the MD5 state by the single move character
+            next_state = state.copy()
+            next_state.update(move.encode())
+
+            # Enqueue the new node and position
+            nodes.append((node, move))
+            queue.append((len(nodes) - 1, next_state, new_x, new_y, depth + 1))
+
+    shortest_path = None
+    if shortest_node is not None:
+        shortest_path = build_path(nodes, shortest_node)
 
     return shortest_path, longest_path_length
 
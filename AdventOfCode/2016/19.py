@@ -14,6 +14,8 @@ The solutions use mathematical insights and efficient algorithms to determine
 the winning elf's number for each part.
 """
 
+import math
+
 
 def part_one(num_elves: int) -> int:
     """
@@ -42,11 +44,9 @@ def part_one(num_elves: int) -> int:
         int: The winning elf's number.
     """
 
-    i = 1
-
-    # Find the largest power of 2 less than or equal to num_elves
-    while i * 2 <= num_elves:
-        i *= 2
+    # The largest power of 2 less than or equal to num_elves is just its
+    # highest set bit
+    i = 1 << (num_elves.bit_length() - 1)
 
     # Calculate the winning position using the Josephus formula
     return 2 * (num_elves - i) + 1
@@ -82,10 +82,13 @@ def part_two(num_elves: int) -> int:
         int: The winning elf's number.
     """
 
-    # Find the largest power of 3 less than or equal to num_elves
-    i = 1
+    # Find the largest power of 3 less than or equal to num_elves. The float
+    # log gives the right exponent or one off, so nudge it at most one step.
+    i = 3 ** int(math.log(num_elves, 3))
     while i * 3 <= num_elves:
         i *= 3
+    while i > num_elves:
+        i //= 3
 
     # Determine the winner based on the offset
     if num_elves == i:
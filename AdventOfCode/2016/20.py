@@ -14,114 +14,125 @@ For example:
     4-7
 """
 
-from typing import List, Tuple
+import numpy as np
+from numpy.typing import NDArray
 
+# Blocked ranges are kept as one contiguous record array rather than a list
+# of tuples, so sorting and merging run over packed uint32 columns.
+RANGE_DTYPE = np.dtype([("start", np.uint32), ("end", np.uint32)])
 
-def read_puzzle_input() -> List[Tuple[int, int]]:
+
+def read_puzzle_input() -> NDArray[np.void]:
     """
-    Reads the input file and parses it into a list of blocked IP ranges.
+    Reads the input file and parses it into an array of blocked IP ranges.
 
     Each line in the file contains a range in the format 'start-end'.
-    This function converts them into a list of (start, end) integer tuples.
+    The whole file is parsed by numpy's C reader, splitting on '-', straight
+    into a structured array with uint32 'start' and 'end' fields.
 
     Returns:
-        List[Tuple[int, int]]: A list of blocked IP ranges.
+        NDArray[np.void]: A structured array of blocked IP ranges.
     """
 
-    with open("20.in", "r") as file:
-        return [tuple(map(int, line.strip().split('-'))) for line in file]
+    return np.loadtxt("20.in", delimiter="-", dtype=RANGE_DTYPE, ndmin=1)
 
 
-def merge_ranges(ranges: List[Tuple[int, int]]) -> List[Tuple[int, int]]:
+def merge_ranges(ranges: NDArray[np.void]) -> NDArray[np.void]:
     """
-    Merges overlapping or adjacent IP ranges into a consolidated list.
+    Merges overlapping or adjacent IP ranges into a consolidated array.
 
-    Given a list of (start, end) tuples, this function:
+    Given a structured array of (start, end) ranges, this function:
     - Sorts them by the starting value.
-    - Merges overlapping or contiguous ranges.
+    - Tracks the running maximum end; a range begins a new merged block
+      only when it starts more than one past that maximum.
+    - Collapses each block to its first start and its running maximum end.
+
+    The merge is done with whole-array operations, so there is no per-range
+    Python loop.
 
     Args:
-        ranges (List[Tuple[int, int]]): List of blocked IP ranges.
+        ranges (NDArray[np.void]): Structured array of blocked IP ranges.
 
     Returns:
-        List[Tuple[int, int]]: A new list of merged IP ranges.
+        NDArray[np.void]: A new structured array of merged IP ranges.
     """
 
-    merged = []  # Stores merged IP ranges
-    for start, end in sorted(ranges):  # Sort the ranges by start value
-        if not merged or merged[-1][1] < start - 1:
-            # If there's no overlap, add a new range
-            merged.append((start, end))
-        else:
-            # Merge overlapping or adjacent ranges
-            merged[-1] = (merged[-1][0], max(merged[-1][1], end))
+    ordered = ranges[np.argsort(ranges["start"], kind="stable")]
+    starts = ordered["start"].astype(np.int64)
+    reach = np.maximum.accumulate(ordered["end"].astype(np.int64))
+
+    # A new block starts wherever the previous blocks can't reach this range
+    is_new = np.ones(len(ordered), dtype=bool)
+    is_new[1:] = starts[1:] > reach[:-1] + 1
+    first = np.flatnonzero(is_new)
+    last = np.append(first[1:] - 1, len(ordered) - 1)
+
+    merged = np.empty(len(first), dtype=RANGE_DTYPE)
+    merged["start"] = starts[first]
+    merged["end"] = reach[last]
     return merged
 
 
-def part_one(data: List[Tuple[int, int]]) -> int:
+def first_free(merged: NDArray[np.void], lo: int = 0) -> int:
     """
-    Finds the first available (non-blocked) IP.
+    Finds the first non-blocked IP at or above `lo`.
 
-    - Merges the input ranges.
-    - Looks for the first gap in the blocked ranges.
-    - If the first blocked range does not start at 0, return 0.
-    - Otherwise, find the first IP that is not covered.
+    Because merged ranges are sorted, disjoint and never adjacent, a binary
+    search on the end column finds the only range that could cover `lo`.
+    If it doesn't, `lo` is free; otherwise the IP right after that range is,
+    so each query is O(log n) and never re-merges the ranges.
 
     Args:
-        data (List[Tuple[int, int]]): List of blocked IP ranges.
+        merged (NDArray[np.void]): Merged ranges from merge_ranges.
+        lo (int, optional): The lowest IP to consider. Defaults to 0.
 
     Returns:
-        int: The first non-blocked IP address.
+        int: The first non-blocked IP that is >= lo.
     """
 
-    merged_ranges = merge_ranges(data)
+    idx = int(np.searchsorted(merged["end"], lo))
+    if idx >= len(merged) or merged["start"][idx] > lo:
+        return lo
+    return int(merged["end"][idx]) + 1
+
+
+def part_one(merged: NDArray[np.void]) -> int:
+    """
+    Finds the first available (non-blocked) IP.
 
-    # If the first blocked range starts after 0, return 0
-    if merged_ranges[0][0] > 0:
-        return 0
+    Args:
+        merged (NDArray[np.void]): Merged ranges from merge_ranges.
 
-    # Look for the first gap in the blocked ranges
-    for i in range(len(merged_ranges) - 1):
-        if merged_ranges[i][1] + 1 < merged_ranges[i + 1][0]:
-            return merged_ranges[i][1] + 1  # First available IP found
+    Returns:
+        int: The first non-blocked IP address.
+    """
 
-    return -1  # Should not happen with valid input
+    return first_free(merged)
 
 
-def part_two(data: List[Tuple[int, int]]) -> int:
+def part_two(merged: NDArray[np.void]) -> int:
     """
     Counts the number of non-blocked IPs in the given range (0 to 4294967295).
 
-    - Merges the input ranges.
-    - Counts all unblocked IPs by finding gaps between merged ranges.
+    Subtracts the total size of the merged (disjoint) blocked ranges from the
+    size of the whole address space.
 
     Args:
-        data (List[Tuple[int, int]]): List of blocked IP ranges.
+        merged (NDArray[np.void]): Merged ranges from merge_ranges.
 
     Returns:
         int: The total count of non-blocked IPs.
     """
 
-    merged_ranges = merge_ranges(data)
     max_ip = 4294967295  # Maximum possible IP in the range
-    allowed_count = 0    # Tracks count of non-blocked IPs
-    prev_end = -1        # Tracks the end of the last processed range
-
-    for start, end in merged_ranges:
-        if start > prev_end + 1:
-            # Count all IPs in the gap between the last blocked range and the
-            # current one
-            allowed_count += start - (prev_end + 1)
-        prev_end = end  # Update the last processed end
-
-    # Count remaining IPs beyond the last blocked range
-    if prev_end < max_ip:
-        allowed_count += max_ip - prev_end
 
-    return allowed_count
+    # Widen before subtracting so a full 0-4294967295 range can't overflow
+    blocked = np.sum(merged["end"].astype(np.int64) - merged["start"] + 1)
+    return max_ip + 1 - int(blocked)
 
 
 if __name__ == "__main__":
-    data = read_puzzle_input()
-    print("Part 1:", part_one(data))  # 19449262
-    print("Part 2:", part_two(data))  # 119
+    # Merge once and share the result between both parts
+    merged = merge_ranges(read_puzzle_input())
+    print("Part 1:", part_one(merged))  # 19449262
+    print("Part 2:", part_two(merged))  # 119
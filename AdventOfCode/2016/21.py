@@ -1,6 +1,6 @@
 #!/usr/bin/env python
 
-import re
+from functools import lru_cache
 
 
 def read_puzzle_input() -> list:
@@ -8,22 +8,44 @@ def read_puzzle_input() -> list:
         return file.read().splitlines()
 
 
+# All of the operations below work in place on a bytearray and also return
+# it, so scramble/unscramble never allocate a new string per instruction.
+
+
 def swap_position(s, x, y):
     """
     Swaps the characters at positions x and y in the string s.
 
     Args:
-        s (str): The input string.
+        s (bytearray): The input string.
         x (int): The first position.
         y (int): The second position.
 
     Returns:
-        str: The string after swapping the characters.
+        bytearray: The string after swapping the characters.
     """
 
-    s = list(s)
     s[x], s[y] = s[y], s[x]
-    return ''.join(s)
+    return s
+
+
+@lru_cache(maxsize=None)
+def swap_table(x, y):
+    """
+    Builds the 256-byte translation table that exchanges letters x and y.
+
+    The same letter pairs come up again and again (and both scramble and
+    unscramble use them), so each table is only built once.
+
+    Args:
+        x (int): The first letter, as a byte value.
+        y (int): The second letter, as a byte value.
+
+    Returns:
+        bytes: The table for bytearray.translate.
+    """
+
+    return bytes.maketrans(bytes((x, y)), bytes((y, x)))
 
 
 def swap_letter(s, x, y):
@@ -31,15 +53,16 @@ def swap_letter(s, x, y):
     Swaps all occurrences of letter x with letter y in the string s.
 
     Args:
-        s (str): The input string.
-        x (str): The first letter.
-        y (str): The second letter.
+        s (bytearray): The input string.
+        x (int): The first letter, as a byte value.
+        y (int): The second letter, as a byte value.
 
     Returns:
-        str: The modified string with letters swapped.
+        bytearray: The modified string with letters swapped.
     """
 
-    return s.replace(x, '#').replace(y, x).replace('#', y)
+    s[:] = s.translate(swap_table(x, y))
+    return s
 
 
 def rotate_left(s, x):
@@ -47,15 +70,16 @@ def rotate_left(s, x):
     Rotates the string left by x positions.
 
     Args:
-        s (str): The input string.
+        s (bytearray): The input string.
         x (int): The number of positions to rotate.
 
     Returns:
-        str: The rotated string.
+        bytearray: The rotated string.
     """
 
     x %= len(s)
-    return s[x:] + s[:x]
+    s[:] = s[x:] + s[:x]
+    return s
 
 
 def rotate_right(s, x):
@@ -63,15 +87,14 @@ def rotate_right(s, x):
     Rotates the string right by x positions.
 
     Args:
-        s (str): The input string.
+        s (bytearray): The input string.
         x (int): The number of positions to rotate.
 
     Returns:
-        str: The rotated string.
+        bytearray: The rotated string.
     """
 
-    x %= len(s)
-    return s[-x:] + s[:-x]
+    return rotate_left(s, -x)
 
 
 def rotate_based_on_position(s, x):
@@ -82,11 +105,12 @@ def rotate_based_on_position(s, x):
         1 + index of x + (1 if index >= 4 else 0).
 
     Args:
-        s (str): The input string.
-        x (str): The letter whose position is used for rotation.
+        s (bytearray): The input string.
+        x (int): The letter whose position is used for rotation, as a byte
+                 value.
 
     Returns:
-        str: The rotated string.
+        bytearray: The rotated string.
     """
 
     idx = s.index(x)
@@ -99,15 +123,16 @@ def reverse_positions(s, x, y):
     Reverses the substring between positions x and y (inclusive).
 
     Args:
-        s (str): The input string.
+        s (bytearray): The input string.
         x (int): The start position.
         y (int): The end position.
 
     Returns:
-        str: The modified string with the specified substring reversed.
+        bytearray: The modified string with the specified substring reversed.
     """
 
-    return s[:x] + s[x:y+1][::-1] + s[y+1:]
+    s[x:y+1] = s[x:y+1][::-1]
+    return s
 
 
 def move_position(s, x, y):
@@ -115,18 +140,64 @@ def move_position(s, x, y):
     Moves the character at position x to position y.
 
     Args:
-        s (str): The input string.
+        s (bytearray): The input string.
         x (int): The original position.
         y (int): The new position.
 
     Returns:
-        str: The modified string after the move.
+        bytearray: The modified string after the move.
     """
 
-    s = list(s)
-    char = s.pop(x)
+    char = s[x]
+    del s[x]
     s.insert(y, char)
-    return ''.join(s)
+    return s
+
+
+def move_position_reverse(s, x, y):
+    """
+    Reverses the 'move position x to position y' operation by moving the
+    character at position y back to position x.
+
+    Args:
+        s (bytearray): The scrambled string.
+        x (int): The original position.
+        y (int): The new position.
+
+    Returns:
+        bytearray: The string before the move.
+    """
+
+    return move_position(s, y, x)
+
+
+def parse_instructions(instructions):
+    """
+    Parses each instruction once into an operation key and its arguments.
+
+    The first two words of an instruction identify the operation, and its
+    arguments always sit at fixed word positions, so no regex is needed.
+    Numeric arguments are converted to ints and letters to their byte
+    values, ready to use on a bytearray.
+
+    Args:
+        instructions (list): A list of string instructions.
+
+    Returns:
+        list: A list of (key, args) tuples, e.g.
+              (('swap', 'position'), (4, 0)).
+    """
+
+    parsed = []
+    for instr in instructions:
+        words = instr.split()
+        key = (words[0], words[1])
+        args = tuple(
+            int(words[i]) if words[i].isdigit() else ord(words[i])
+            for i in ARGUMENT_WORDS[key]
+        )
+        parsed.append((key, args))
+    return parsed
 
 
 def scramble(s, instructions):
@@ -135,58 +206,69 @@ def scramble(s, instructions):
 
     Args:
         s (str): The initial string.
-        instructions (list): A list of string instructions.
+        instructions (list): Parsed instructions from parse_instructions.
 
     Returns:
         str: The scrambled string.
     """
 
-    for instr in instructions:
-        if m := re.match(r"swap position (\d+) with position (\d+)", instr):
-            x, y = map(int, m.groups())
-            s = swap_position(s, x, y)
-        elif m := re.match(r"swap letter (\w) with letter (\w)", instr):
-            x, y = m.groups()
-            s = swap_letter(s, x, y)
-        elif m := re.match(r"rotate left (\d+) steps?", instr):
-            x = int(m.group(1))
-            s = rotate_left(s, x)
-        elif m := re.match(r"rotate right (\d+) steps?", instr):
-            x = int(m.group(1))
-            s = rotate_right(s, x)
-        elif m := re.match(r"rotate based on position of letter (\w)", instr):
-            x = m.group(1)
-            s = rotate_based_on_position(s, x)
-        elif m := re.match(r"reverse positions (\d+) through (\d+)", instr):
-            x, y = map(int, m.groups())
-            s = reverse_positions(s, x, y)
-        elif m := re.match(r"move position (\d+) to position (\d+)", instr):
-            x, y = map(int, m.groups())
-            s = move_position(s, x, y)
-    return s
+    b = bytearray(s, 'ascii')
+    for key, args in instructions:
+        OPERATIONS[key](b, *args)
+    return b.decode('ascii')
+
+
+@lru_cache(maxsize=None)
+def reverse_rotations(length):
+    """
+    Builds the table used to undo 'rotate based on position of letter' for
+    strings of the given length.
+
+    A letter that started at index p is rotated right by
+    1 + p + (1 if p >= 4 else 0), so where it ends up depends only on p and
+    the length. For each possible final index q this finds the left rotation
+    that puts the letter back where it started (the smallest one, if more
+    than one would do).
+
+    Args:
+        length (int): The length of the string.
+
+    Returns:
+        dict: Maps the letter's final index to the left rotation that undoes
+              the operation.
+    """
+
+    table = {}
+    for q in range(length):
+        for i in range(length):
+            p = (q - i) % length  # Where the letter was before the rotation
+            if (1 + p + (1 if p >= 4 else 0)) % length == i:
+                table[q] = i
+                break
+    return table
 
 
 def rotate_based_on_position_reverse(s, x):
     """
     Reverses the 'rotate based on position of letter' operation.
 
-    Since the original operation is complex, this function brute-forces all
-    possible original positions and finds which one would lead to the given
-    scrambled string.
+    The left rotation that undoes it only depends on the string's length and
+    where the letter ended up, so it's a lookup in a table that is built
+    once per length.
 
     Args:
-        s (str): The scrambled string.
-        x (str): The letter that was used for the rotation.
+        s (bytearray): The scrambled string.
+        x (int): The letter that was used for the rotation, as a byte value.
 
     Returns:
-        str: The original string before the rotation.
+        bytearray: The original string before the rotation.
     """
 
-    for i in range(len(s)):
-        test = rotate_left(s, i)
-        if rotate_based_on_position(test, x) == s:
-            return test
-    raise ValueError("Rotation reversal failed!")
+    table = reverse_rotations(len(s))
+    q = s.index(x)
+    if q not in table:
+        raise ValueError("Rotation reversal failed!")
+    return rotate_left(s, table[q])
 
 
 def unscramble(s, instructions):
@@ -195,43 +277,56 @@ def unscramble(s, instructions):
 
     Args:
         s (str): The scrambled string.
-        instructions (list): A list of string instructions.
+        instructions (list): Parsed instructions from parse_instructions.
 
     Returns:
         str: The original unscrambled string.
     """
 
-    for instr in reversed(instructions):
-        if m := re.match(r"swap position (\d+) with position (\d+)", instr):
-            x, y = map(int, m.groups())
-            s = swap_position(s, x, y)
-        elif m := re.match(r"swap letter (\w) with letter (\w)", instr):
-            x, y = m.groups()
-            s = swap_letter(s, x, y)
-        elif m := re.match(r"rotate left (\d+) steps?", instr):
-            x = int(m.group(1))
-            s = rotate_right(s, x)
-        elif m := re.match(r"rotate right (\d+) steps?", instr):
-            x = int(m.group(1))
-            s = rotate_left(s, x)
-        elif m := re.match(r"rotate based on position of letter (\w)", instr):
-            x = m.group(1)
-            s = rotate_based_on_position_reverse(s, x)
-        elif m := re.match(r"reverse positions (\d+) through (\d+)", instr):
-            x, y = map(int, m.groups())
-            s = reverse_positions(s, x, y)
-        elif m := re.match(r"move position (\d+) to position (\d+)", instr):
-            x, y = map(int, m.groups())
-            s = move_position(s, y, x)
-    return s
+    b = bytearray(s, 'ascii')
+    for key, args in reversed(instructions):
+        INVERSE_OPERATIONS[key](b, *args)
+    return b.decode('ascii')
+
+
+# Word positions of each operation's arguments, keyed by its first two words
+ARGUMENT_WORDS = {
+    ('swap', 'position'): (2, 5),
+    ('swap', 'letter'): (2, 5),
+    ('rotate', 'left'): (2,),
+    ('rotate', 'right'): (2,),
+    ('rotate', 'based'): (6,),
+    ('reverse', 'positions'): (2, 4),
+    ('move', 'position'): (2, 5),
+}
+
+OPERATIONS = {
+    ('swap', 'position'): swap_position,
+    ('swap', 'letter'): swap_letter,
+    ('rotate', 'left'): rotate_left,
+    ('rotate', 'right'): rotate_right,
+    ('rotate', 'based'): rotate_based_on_position,
+    ('reverse', 'positions'): reverse_positions,
+    ('move', 'position'): move_position,
+}
+
+INVERSE_OPERATIONS = {
+    ('swap', 'position'): swap_position,
+    ('swap', 'letter'): swap_letter,
+    ('rotate', 'left'): rotate_right,
+    ('rotate', 'right'): rotate_left,
+    ('rotate', 'based'): rotate_based_on_position_reverse,
+    ('reverse', 'positions'): reverse_positions,
+    ('move', 'position'): move_position_reverse,
+}
 
 
 def part_one(data: list) -> str:
-    return scramble('abcdefgh', data)
+    return scramble('abcdefgh', parse_instructions(data))
 
 
 def part_two(data: list) -> str:
-    return unscramble('fbgdceah', data)
+    return unscramble('fbgdceah', parse_instructions(data))
 
 
 if __name__ == "__main__":
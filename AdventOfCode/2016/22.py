@@ -18,9 +18,11 @@ The grid contains special nodes:
     - Origin (top-left corner): Represented as 'O' in visualization
 """
 
-import re
+import sys
 from collections import deque
 
+import numpy as np
+
 
 def read_puzzle_input() -> list:
     """
@@ -38,15 +40,20 @@ def read_puzzle_input() -> list:
     """
 
     nodes = []
-    pattern = r".*-x(\d+)-y(\d+)\s+(\d+)T\s+(\d+)T\s+(\d+)T\s+(\d+)%"
     with open("22.in", "r") as file:
         for line in file.read().strip().split('\n'):
             if line.startswith('/dev/grid'):
-                match = re.match(pattern, line)
-                if match is None:
+                # The columns are fixed, so plain splits do the job: the
+                # name ends in -x<N>-y<N> and each figure has a unit suffix
+                try:
+                    name, size, used, avail, use_percent = line.split()
+                    _, x, y = name.rsplit('-', 2)
+                    nodes.append((
+                        int(x[1:]), int(y[1:]), int(size[:-1]),
+                        int(used[:-1]), int(avail[:-1]), int(use_percent[:-1])
+                    ))
+                except ValueError:
                     raise ValueError(f"Failed to parse line: {line}")
-                x, y, size, used, avail, use_percent = map(int, match.groups())
-                nodes.append((x, y, size, used, avail, use_percent))
     return nodes
 
 
@@ -56,28 +63,29 @@ def is_empty(node):
     return node[3] == 0  # node[3] is the 'used' value
 
 
-def find_viable_pairs(nodes):
+def count_viable_pairs(nodes):
     """
-    Find all viable pairs of nodes where data from A could fit in node B.
+    Count all viable pairs of nodes where data from A could fit in node B.
 
     A pair is viable if:
     1. Node A is not empty
     2. Nodes A and B are different nodes
     3. Node A's used space would fit in Node B's available space
 
+    Rather than looping over every pair in Python, the used and available
+    columns are compared against each other as one broadcast boolean
+    matrix, and the diagonal (a node paired with itself) is subtracted.
+
     Returns:
-        List of tuples, each containing (node_a, node_b) representing viable
-        pairs
+        Number of viable pairs
     """
 
-    pairs = []
-    for a in nodes:
-        if is_empty(a):
-            continue
-        for b in nodes:
-            if a != b and a[3] <= b[4]:  # a.used <= b.avail
-                pairs.append((a, b))
-    return pairs
+    used = np.fromiter((n[3] for n in nodes), dtype=np.int32)
+    avail = np.fromiter((n[4] for n in nodes), dtype=np.int32)
+
+    # fits[a, b] is True when non-empty node a's data fits in node b
+    fits = (used[:, None] <= avail[None, :]) & (used[:, None] > 0)
+    return int(np.count_nonzero(fits) - np.count_nonzero(np.diagonal(fits)))
 
 
 def visualize_grid(nodes):
@@ -97,12 +105,13 @@ def visualize_grid(nodes):
 
     max_x = max(n[0] for n in nodes)  # n[0] is x
     max_y = max(n[1] for n in nodes)  # n[1] is y
+    lookup = {(n[0], n[1]): n for n in nodes}  # (x, y) -> node
     grid = []
 
     for y in range(max_y + 1):
         row = []
         for x in range(max_x + 1):
-            node = next(n for n in nodes if n[0] == x and n[1] == y)
+            node = lookup[(x, y)]
             if is_empty(node):
                 row.append('_')
             elif node[3] > 100:  # used > 100
@@ -118,6 +127,40 @@ def visualize_grid(nodes):
     return '\n'.join(grid)
 
 
+def wall_detour(start, target, walls, max_x):
+    """
+    Closed-form distance for the empty node to reach the target.
+
+    Puzzle grids have a single horizontal band of walls running from some
+    column out to the right edge, leaving a gap on its left. The empty node
+    either has a straight run to the target, or it has to walk over to the
+    gap, up through it and across. Any other layout returns None so the
+    caller can fall back to a BFS.
+
+    Returns:
+        Number of steps, or None if the grid doesn't have that shape
+    """
+
+    (ex, ey), (tx, ty) = start, target
+    if not walls:
+        return abs(ex - tx) + abs(ey - ty)
+
+    rows = {y for _, y in walls}
+    if len(rows) != 1 or ty != 0:
+        return None
+    wall_y = rows.pop()
+    xs = sorted(x for x, _ in walls)
+    if wall_y == 0 or xs[0] == 0 or xs != list(range(xs[0], max_x + 1)):
+        return None
+
+    gap_x = xs[0] - 1  # Rightmost column the band leaves open
+    if ey < wall_y or ex <= gap_x:
+        # Nothing in the way: straight up, then along the top row
+        return abs(ex - tx) + ey
+    # Round the end of the band, through the gap and on to the target
+    return (ex - gap_x) + ey + abs(gap_x - tx)
+
+
 def find_shortest_path(nodes):
     """
     Find minimum steps needed to move goal data to origin.
@@ -173,11 +216,16 @@ def find_shortest_path(nodes):
                     visited.add(next_pos)
                     queue.append((next_pos, steps + 1))
 
-        return float('inf')
+        return sys.maxsize
 
     # Calculate total steps:
-    # 1. Move empty node next to goal data
-    empty_to_goal = bfs(start_pos, target_pos)
+    # 1. Move empty node next to goal data, straight from the layout of the
+    #    walls when it's the usual band, otherwise with a BFS
+    empty_to_goal = wall_detour(start_pos, target_pos, walls, max_x)
+    if empty_to_goal is None:
+        empty_to_goal = bfs(start_pos, target_pos)
+    if empty_to_goal == sys.maxsize:
+        return sys.maxsize  # The goal data can't be reached
 
     # 2. Moving goal data to (0,0) takes 5 steps per position
     # For each position we need to:
@@ -189,7 +237,7 @@ def find_shortest_path(nodes):
 
 
 def part_one(data: list) -> int:
-    return len(find_viable_pairs(data))
+    return count_viable_pairs(data)
 
 
 def part_two(data: list) -> int:
@@ -1,6 +1,9 @@
 #!/usr/bin/env python
 
-import math
+# Opcodes; ADD and MUL are macro-ops only ever produced by optimize()
+CPY, INC, DEC, JNZ, TGL, ADD, MUL = range(7)
+OPCODES = {'cpy': CPY, 'inc': INC, 'dec': DEC, 'jnz': JNZ, 'tgl': TGL}
+REGISTERS = 'abcd'
 
 
 def read_puzzle_input() -> list:
@@ -8,73 +11,194 @@ def read_puzzle_input() -> list:
         return file.read().splitlines()
 
 
-def get_value(registers, x):
-    """Returns the value of x, whether it's a register or integer"""
-    return registers[x]if x in registers else int(x)
-
-
-def execute(instructions, registers):
-    """Executes the given assembly-like instructions."""
-
-    # Reddit Hack!!! look for the following lines:
-    #    cpy 71 c
-    #    jnz 75 d
-    if registers['a'] == 12:
-        return {'a': math.factorial(12) + (71 * 75)}
+def parse_operand(token):
+    """
+    Returns (value, is_register) for a token: a register's index into the
+    register list, or an integer literal.
+    """
+    if token in REGISTERS:
+        return REGISTERS.index(token), True
+    return int(token), False
+
+
+def parse_instructions(instructions):
+    """
+    Compiles the assembunny source into bytecode, once.
+
+    Each instruction becomes [opcode, x, x_is_reg, y, y_is_reg], with y set
+    to (0, False) for one-argument instructions. Instructions are lists
+    because tgl rewrites their opcode in place.
+
+    Args:
+        instructions (list): The assembunny source lines.
+
+    Returns:
+        list: The compiled program.
+    """
+
+    program = []
+    for line in instructions:
+        cmd, *args = line.split()
+        operands = [parse_operand(arg) for arg in args] + [(0, False)]
+        (x, x_reg), (y, y_reg) = operands[0], operands[1]
+        program.append([OPCODES[cmd], x, x_reg, y, y_reg])
+    return program
+
+
+def op_cpy(registers, program, pc, ins):
+    """cpy x y: copies x into register y."""
+    _, x, x_reg, y, y_reg = ins
+    if y_reg:
+        registers[y] = registers[x] if x_reg else x
+    return pc + 1
+
+
+def op_inc(registers, program, pc, ins):
+    """inc x: increments register x."""
+    if ins[2]:
+        registers[ins[1]] += 1
+    return pc + 1
+
+
+def op_dec(registers, program, pc, ins):
+    """dec x: decrements register x."""
+    if ins[2]:
+        registers[ins[1]] -= 1
+    return pc + 1
+
+
+def op_jnz(registers, program, pc, ins):
+    """jnz x y: jumps y instructions away if x is not zero."""
+    _, x, x_reg, y, y_reg = ins
+    if (registers[x] if x_reg else x) != 0:
+        return pc + (registers[y] if y_reg else y)
+    return pc + 1
+
+
+def op_tgl(registers, program, pc, ins):
+    """tgl x: toggles the instruction x instructions away."""
+    _, x, x_reg, _, _ = ins
+    target = pc + (registers[x] if x_reg else x)
+    if 0 <= target < len(program):
+        target_ins = program[target]
+        if target_ins[0] in (INC, DEC, TGL):  # One-argument commands
+            target_ins[0] = DEC if target_ins[0] == INC else INC
+        else:  # Two-argument commands
+            target_ins[0] = CPY if target_ins[0] == JNZ else JNZ
+    return pc + 1
+
+
+def op_add(registers, program, pc, ins):
+    """
+    Macro-op for the loop 'inc a; dec b; jnz b -2' (in either order of the
+    inc and dec): adds b to a and clears b in one step.
+    """
+    _, a, b = ins
+    if registers[b] > 0:
+        registers[a] += registers[b]
+        registers[b] = 0
+        return pc + 3
+    # The loop wouldn't terminate normally, so run the real instruction
+    return OPS[program[pc][0]](registers, program, pc, program[pc])
+
+
+def op_mul(registers, program, pc, ins):
+    """
+    Macro-op for the nested loop
+        cpy x c; inc a; dec c; jnz c -2; dec d; jnz d -5
+    which adds x * d to a and leaves c and d at zero.
+    """
+    _, x, x_reg, c, a, d = ins
+    factor = registers[x] if x_reg else x
+    if factor > 0 and registers[d] > 0:
+        registers[a] += factor * registers[d]
+        registers[c] = 0
+        registers[d] = 0
+        return pc + 6
+    # The loops wouldn't terminate normally, so run the real instruction
+    return OPS[program[pc][0]](registers, program, pc, program[pc])
+
+
+# Handlers indexed by opcode
+OPS = [op_cpy, op_inc, op_dec, op_jnz, op_tgl, op_add, op_mul]
+
+
+def optimize(program):
+    """
+    Peephole pass that spots the add and multiply loops the assembunny
+    programs are built from and puts a macro-op at the head of each one.
+
+    Only the head slot is replaced, so jumps into the middle of a loop still
+    land on the original instructions. The macro-ops fall back to the
+    original head instruction whenever their loop wouldn't terminate.
+
+    Args:
+        program (list): The compiled program from parse_instructions.
+
+    Returns:
+        list: The program with macro-ops substituted in.
+    """
+
+    code = list(program)
+    for i in range(len(program)):
+        window = program[i:i + 6]
+        ops = [ins[0] for ins in window]
+        if ops == [CPY, INC, DEC, JNZ, DEC, JNZ]:
+            cpy, inc, dec_c, jnz_c, dec_d, jnz_d = window
+            x, x_reg, c = cpy[1], cpy[2], cpy[3]
+            a, d = inc[1], dec_d[1]
+            if (cpy[4] and inc[2] and dec_d[2]
+                    and dec_c[1:3] == jnz_c[1:3] == [c, True]
+                    and jnz_d[1:3] == [d, True]
+                    and jnz_c[3:] == [-2, False] and jnz_d[3:] == [-5, False]
+                    and len({a, c, d}) == 3
+                    and not (x_reg and x in (a, c, d))):
+                code[i] = [MUL, x, x_reg, c, a, d]
+                continue
+        if ops[:3] in ([INC, DEC, JNZ], [DEC, INC, JNZ]):
+            first, second, jnz = window[:3]
+            inc, dec = (first, second) if ops[0] == INC else (second, first)
+            a, b = inc[1], dec[1]
+            if (inc[2] and dec[2] and jnz[1:] == [b, True, -2, False]
+                    and a != b):
+                code[i] = [ADD, a, b]
+    return code
+
+
+def execute(program, registers):
+    """
+    Executes the given compiled program.
+
+    The program is passed through the peephole optimizer, which turns its
+    add and multiply loops into single macro-ops. A tgl can rewrite the
+    program, so the optimizer is re-run after each one.
+
+    Args:
+        program (list): The compiled program from parse_instructions.
+        registers (list): The values of registers a, b, c and d.
+
+    Returns:
+        list: The registers after the program halts.
+    """
+
+    code = optimize(program)
     pc = 0  # Program counter
 
-    while pc < len(instructions):
-        parts = instructions[pc].split()
-        cmd = parts[0]
-
-        if cmd == "cpy":  # cpy x y
-            x, y = parts[1], parts[2]
-            if y in registers:
-                registers[y] = get_value(registers, x)
-
-        elif cmd == "inc":  # inc x
-            x = parts[1]
-            if x in registers:
-                registers[x] += 1
-
-        elif cmd == "dec":  # dec x
-            x = parts[1]
-            if x in registers:
-                registers[x] -= 1
-
-        elif cmd == "jnz":  # jnz x y
-            x, y = parts[1], parts[2]
-            if get_value(registers, x) != 0:
-                # Adjust for automatic +1 at loop end
-                pc += get_value(registers, y) - 1
-
-        elif cmd == "tgl":  # tgl x
-            x = get_value(registers, parts[1])
-            target = pc + x
-            if 0 <= target < len(instructions):
-                target_cmd = instructions[target].split()
-                if len(target_cmd) == 2:  # One-argument commands
-                    instructions[target] = (
-                        "dec" if target_cmd[0] == "inc" else "inc"
-                    ) + " " + target_cmd[1]
-                elif len(target_cmd) == 3:  # Two-argument commands
-                    instructions[target] = (
-                        "cpy" if target_cmd[0] == "jnz" else "jnz"
-                    ) + " " + " ".join(target_cmd[1:])
-
-        pc += 1  # Move to the next instruction
+    while 0 <= pc < len(program):
+        ins = code[pc]
+        pc = OPS[ins[0]](registers, program, pc, ins)
+        if ins[0] == TGL:
+            code = optimize(program)
 
     return registers
 
 
 def part_one(data: list) -> int:
-    registers = {'a': 7, 'b': 0, 'c': 0, 'd': 0}
-    return execute(data.copy(), registers)['a']
+    return execute(parse_instructions(data), [7, 0, 0, 0])[0]
 
 
 def part_two(data: list) -> int:
-    registers = {'a': 12, 'b': 0, 'c': 0, 'd': 0}
-    return execute(data.copy(), registers)['a']
+    return execute(parse_instructions(data), [12, 0, 0, 0])[0]
 
 
 if __name__ == "__main__":
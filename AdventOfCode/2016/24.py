@@ -6,11 +6,12 @@ Advent of Code 2016, Day 24: Air Duct Spelunking
 This script solves the Day 24 puzzle of Advent of Code 2016. The problem
 involves navigating through a grid to collect numbered points in the shortest
 number of steps. The solution uses Breadth-First Search (BFS) to compute
-distances and permutations to find the optimal path.
+distances and Held-Karp dynamic programming to find the optimal path.
 """
 
+import sys
 from collections import deque
-from itertools import permutations
+from functools import lru_cache
 
 
 def read_puzzle_input() -> list:
@@ -46,56 +47,87 @@ def parse_grid(grid: list) -> dict:
     return points
 
 
-def bfs_distance(grid: list, start: tuple, end: tuple) -> int:
+def bfs_all(cells: bytes, width: int, start: int, targets: set) -> dict:
     """
-    Computes the shortest distance between two points using Breadth-First
-    Search (BFS).
+    Computes the shortest distance from one point to each of the targets
+    with a single Breadth-First Search (BFS).
+
+    The search front sweeps outwards from the start, recording the distance
+    to every target it reaches, and stops once all of them have been found.
+    Positions are flat indices into the grid buffer, so neighbours are just
+    p - 1, p + 1, p - width and p + width, and visited cells are tracked in
+    a bytearray rather than a set of tuples.
 
     Args:
-        grid (list): A list of strings representing the grid.
-        start (tuple): The starting coordinates (x, y).
-        end (tuple): The target coordinates (x, y).
+        cells (bytes): The grid as one flat buffer, surrounded by walls (see
+                       flatten_grid).
+        width (int): The row length of the flat buffer.
+        start (int): The flat index to start from.
+        targets (set): The flat indices to measure.
 
     Returns:
-        int: The shortest distance between the two points, or -1 if no path
-             exists.
+        dict: A dictionary mapping each reachable target to its shortest
+              distance from the start.
     """
 
+    wall = ord('#')
+    steps = (-1, 1, -width, width)  # left, right, up, down
+
     queue = deque([(start, 0)])  # Stores (position, distance)
-    visited = set()  # Tracks visited positions to avoid reprocessing
+    visited = bytearray(len(cells))  # Tracks visited positions
+    visited[start] = 1
+    found = {}
+    remaining = len(targets)
+
+    while queue and remaining:
+        pos, dist = queue.popleft()
+
+        # Record the distance if this position is one of the targets
+        if pos in targets:
+            found[pos] = dist
+            remaining -= 1
+
+        # Explore all 4 possible directions; the wall border means a step
+        # never leaves the buffer or wraps onto another row
+        for step in steps:
+            nxt = pos + step
+            if not visited[nxt] and cells[nxt] != wall:
+                visited[nxt] = 1
+                queue.append((nxt, dist + 1))
 
-    while queue:
-        (x, y), dist = queue.popleft()
+    return found
 
-        # If the target position is reached, return the distance
-        if (x, y) == end:
-            return dist
 
-        # Skip if the position has already been visited
-        if (x, y) in visited:
-            continue
+def flatten_grid(grid: list) -> tuple:
+    """
+    Packs the grid into one flat bytes buffer with a wall border.
+
+    Every row gets a trailing wall and a row of walls is added above and
+    below, so cell (x, y) is at index (y + 1) * width + x and all four
+    neighbours of any open cell are inside the buffer.
 
-        # Mark the current position as visited
-        visited.add((x, y))
+    Args:
+        grid (list): A list of strings representing the grid.
 
-        # Explore all 4 possible directions (up, down, left, right)
-        for dx, dy in [(-1, 0), (1, 0), (0, -1), (0, 1)]:
-            nx, ny = x + dx, y + dy
+    Returns:
+        tuple: The flat buffer and its row width.
+    """
 
-            # Check if the new position is within bounds and not a wall
-            if (0 <= nx < len(grid[0]) and 0 <= ny < len(grid) and
-                    grid[ny][nx] != '#'):
-                # Add the new position to the queue with an incremented
-                # distance
-                queue.append(((nx, ny), dist + 1))
-    # If no path is found, return -1 (should not happen for valid inputs)
-    return -1
+    width = len(grid[0]) + 1
+    border = b'#' * width
+    rows = b''.join(row.encode('ascii') + b'#' for row in grid)
+    return border + rows + border, width
 
 
 def compute_pairwise_distances(grid: list, points: dict) -> dict:
     """
     Computes the shortest distances between all pairs of numbered points.
 
+    One BFS per point measures its distance to every later point at once,
+    and since the grid is undirected that also gives the reverse distance.
+    So the grid is swept N - 1 times, each sweep looking for fewer targets,
+    rather than once per pair.
+
     Args:
         grid (list): A list of strings representing the grid.
         points (dict): A dictionary mapping point numbers to their coordinates.
@@ -105,97 +137,123 @@ def compute_pairwise_distances(grid: list, points: dict) -> dict:
               distance.
     """
 
+    cells, width = flatten_grid(grid)
+    flat = {n: (y + 1) * width + x for n, (x, y) in points.items()}
+
+    order = sorted(points)
     distances = {}
-    for a in points:
-        for b in points:
-            if a != b:
-                # Compute the shortest distance between points a & b using BFS
-                distances[(a, b)] = bfs_distance(grid, points[a], points[b])
+    for i, a in enumerate(order[:-1]):
+        later = order[i + 1:]
+        found = bfs_all(cells, width, flat[a], {flat[b] for b in later})
+        for b in later:
+            # -1 marks a point that can't be reached (not in valid input)
+            distances[(a, b)] = distances[(b, a)] = found.get(flat[b], -1)
     return distances
 
 
-def part_one(data: list) -> int:
+def held_karp(distances: dict, num_points: int) -> list:
     """
-    Solves Part 1 of the puzzle: Finds the shortest path to visit all points
-    starting from 0.
+    Finds the shortest routes from point 0 through every point using the
+    Held-Karp bitmask dynamic program.
+
+    best[mask][i] is the shortest route that starts at 0, visits exactly the
+    points in `mask` and ends at point i. Extending every such route by one
+    unvisited point fills the table in O(N^2 * 2^N), rather than the
+    O(N * N!) of trying every visiting order.
 
     Args:
-        data (list): A list of strings representing the grid.
+        distances (dict): Shortest distances between pairs of points.
+        num_points (int): The number of numbered points.
 
     Returns:
-        int: The shortest distance to visit all points.
+        list: For each point i, the shortest route from 0 that visits all
+              points and ends at i.
     """
 
-    # Parse the grid to find the positions of all numbered points
-    points = parse_grid(data)
-    num_points = len(points)
+    full = (1 << num_points) - 1
+    best = [[sys.maxsize] * num_points for _ in range(1 << num_points)]
+    best[1][0] = 0  # Only point 0 visited, standing on it
+
+    for mask in range(1, full + 1, 2):  # Every route includes point 0
+        for i in range(num_points):
+            cost = best[mask][i]
+            if cost == sys.maxsize:
+                continue
+            for j in range(num_points):
+                if mask & (1 << j):
+                    continue
+                # Extend the route ending at i on to the unvisited point j
+                next_mask = mask | (1 << j)
+                next_cost = cost + distances[(i, j)]
+                if next_cost < best[next_mask][j]:
+                    best[next_mask][j] = next_cost
+
+    return best[full]
+
+
+@lru_cache(maxsize=1)
+def find_routes(grid: tuple) -> tuple:
+    """
+    Does the work shared by both parts: locating the points, measuring the
+    distances between them and running the route search.
 
-    # Compute the shortest distances between all pairs of points
-    distances = compute_pairwise_distances(data, points)
+    The result is cached, so when part_one and part_two are run on the same
+    grid the BFS sweeps and DP only happen once.
 
-    # Generate all permutations of the points (excluding the starting point 0)
-    points_to_visit = list(range(1, num_points))
-    min_distance = float('inf')
+    Args:
+        grid (tuple): A tuple of strings representing the grid (hashable so
+                      it can be cached).
 
-    # Try all possible orders of visiting the points
-    for perm in permutations(points_to_visit):
-        # Start with the distance from point 0 to the first point in the
-        # permutation
-        current_distance = distances[(0, perm[0])]
+    Returns:
+        tuple: The pairwise distances and, for each point i, the shortest
+               route from 0 that visits all points and ends at i.
+    """
 
-        # Add the distances between consecutive points in the permutation
-        for i in range(len(perm) - 1):
-            current_distance += distances[(perm[i], perm[i + 1])]
+    # Parse the grid to find the positions of all numbered points
+    points = parse_grid(list(grid))
 
-        # Update the minimum distance if the current path is shorter
-        if current_distance < min_distance:
-            min_distance = current_distance
+    # Compute the shortest distances between all pairs of points
+    distances = compute_pairwise_distances(list(grid), points)
 
-    return int(min_distance)
+    return distances, held_karp(distances, len(points))
 
 
-def part_two(data: list) -> int:
+def part_one(data: list) -> int:
     """
-    Solves Part 2 of the puzzle: Finds the shortest path to visit all points
-    and return to 0.
+    Solves Part 1 of the puzzle: Finds the shortest path to visit all points
+    starting from 0.
 
     Args:
         data (list): A list of strings representing the grid.
 
     Returns:
-        int: The shortest distance to visit all points and return to the start.
+        int: The shortest distance to visit all points.
     """
 
-    # Parse the grid to find the positions of all numbered points
-    points = parse_grid(data)
-    num_points = len(points)
+    _, routes = find_routes(tuple(data))
 
-    # Compute the shortest distances between all pairs of points
-    distances = compute_pairwise_distances(data, points)
+    # The route may end at whichever point is cheapest
+    return min(routes)
 
-    # Generate all permutations of the points (excluding the starting point 0)
-    points = list(range(1, num_points))
-    min_distance = float('inf')
 
-    # Try all possible orders of visiting the points
-    for perm in permutations(points):
-        # Start with the distance from point 0 to the first point in the
-        # permutation
-        current_distance = distances[(0, perm[0])]
+def part_two(data: list) -> int:
+    """
+    Solves Part 2 of the puzzle: Finds the shortest path to visit all points
+    and return to 0.
 
-        # Add the distances between consecutive points in the permutation
-        for i in range(len(perm) - 1):
-            current_distance += distances[(perm[i], perm[i + 1])]
+    Args:
+        data (list): A list of strings representing the grid.
 
-            # Add the distance to return to point 0 from the last point in the
-            # permutation
-        current_distance += distances[(perm[-1], 0)]  # Return to 0
+    Returns:
+        int: The shortest distance to visit all points and return to the start.
+    """
 
-        # Update the minimum distance if the current path is shorter
-        if current_distance < min_distance:
-            min_distance = current_distance
+    distances, routes = find_routes(tuple(data))
 
-    return int(min_distance)
+    # Close each route by walking back from its last point to 0
+    return min(
+        cost + distances[(i, 0)] for i, cost in enumerate(routes) if i != 0
+    )
 
 
 if __name__ == "__main__":
@@ -2,64 +2,146 @@
 
 from itertools import count
 
+# Opcodes
+CPY, INC, DEC, JNZ, OUT = range(5)
+OPCODES = {'cpy': CPY, 'inc': INC, 'dec': DEC, 'jnz': JNZ, 'out': OUT}
+REGISTERS = 'abcd'
+
 
 def read_puzzle_input() -> list:
     with open("25.in", "r") as file:
         return file.read().splitlines()
 
 
-def get_value(registers, x):
-    """Returns the value of x, whether it's a register or integer"""
-    return registers[x] if x in registers else int(x)
+def parse_operand(token):
+    """
+    Returns (value, is_register) for a token: a register's index into the
+    register list, or an integer literal.
+    """
+    if token in REGISTERS:
+        return REGISTERS.index(token), True
+    return int(token), False
 
 
-def execute(instructions, a_start):
-    """Executes the given assembly-like instructions."""
+def parse_instructions(instructions):
+    """
+    Compiles the assembunny source into bytecode, once.
 
-    registers = {'a': a_start, 'b': 0, 'c': 0, 'd': 0}
+    Each instruction becomes (opcode, x, x_is_reg, y, y_is_reg), with y set
+    to (0, False) for one-argument instructions.
 
-    pc = 0  # Program counter
-    output = []
+    Args:
+        instructions (list): The assembunny source lines.
+
+    Returns:
+        list: The compiled program.
+    """
+
+    program = []
+    for line in instructions:
+        cmd, *args = line.split()
+        operands = [parse_operand(arg) for arg in args] + [(0, False)]
+        (x, x_reg), (y, y_reg) = operands[0], operands[1]
+        program.append((OPCODES[cmd], x, x_reg, y, y_reg))
+    return program
+
+
+def op_cpy(registers, pc, ins, output):
+    """cpy x y: copies x into register y."""
+    _, x, x_reg, y, y_reg = ins
+    if y_reg:
+        registers[y] = registers[x] if x_reg else x
+    return pc + 1
+
+
+def op_inc(registers, pc, ins, output):
+    """inc x: increments register x."""
+    if ins[2]:
+        registers[ins[1]] += 1
+    return pc + 1
+
+
+def op_dec(registers, pc, ins, output):
+    """dec x: decrements register x."""
+    if ins[2]:
+        registers[ins[1]] -= 1
+    return pc + 1
 
-    while 0 <= pc < len(instructions):
-        parts = instructions[pc].split()
-        cmd = parts[0]
 
-        if cmd == 'cpy':
-            x, y = parts[1], parts[2]
-            if y in registers:
-                registers[y] = get_value(registers, x)
+def op_jnz(registers, pc, ins, output):
+    """jnz x y: jumps y instructions away if x is not zero."""
+    _, x, x_reg, y, y_reg = ins
+    if (registers[x] if x_reg else x) != 0:
+        return pc + (registers[y] if y_reg else y)
+    return pc + 1
 
-        elif cmd == 'inc':
-            x = parts[1]
-            if x in registers:
-                registers[x] += 1
 
-        elif cmd == 'dec':
-            x = parts[1]
-            if x in registers:
-                registers[x] -= 1
+def op_out(registers, pc, ins, output):
+    """out x: transmits x."""
+    _, x, x_reg, _, _ = ins
+    output.append(registers[x] if x_reg else x)
+    return pc + 1
 
-        elif cmd == 'jnz':
-            x, y = parts[1], parts[2]
-            if get_value(registers, x) != 0:
-                pc += get_value(registers, y) - 1
 
-        elif cmd == 'out':
-            value = get_value(registers, parts[1])
-            output.append(value)
-            if len(output) >= 20:
-                return output
+# Handlers indexed by opcode
+OPS = [op_cpy, op_inc, op_dec, op_jnz, op_out]
+
+
+def execute(program, a_start, failed):
+    """
+    Runs the compiled program and reports whether it transmits an endless
+    clock signal (0, 1, 0, 1, ...).
+
+    Rather than collecting a fixed number of outputs, the run stops as soon
+    as an output breaks the pattern, or as soon as the machine state
+    (pc, registers and which value is due next) right after an 'out'
+    repeats. A repeat means the program is in a loop whose outputs so far
+    all matched, so the signal carries on forever.
+
+    States from failed runs are remembered in `failed`, along with whether
+    the next expected output is 0 or 1, so later starting values that reach
+    one of them are rejected straight away.
+
+    Args:
+        program (list): The compiled program from parse_instructions.
+        a_start (int): The starting value of register a.
+        failed (set): States known to lead to a broken signal; updated in
+                      place.
+
+    Returns:
+        bool: True if the output is an endless clock signal.
+    """
+
+    registers = [a_start, 0, 0, 0]
+
+    pc = 0  # Program counter
+    output = []
+    seen = set()  # States reached right after an 'out'
+
+    while 0 <= pc < len(program):
+        ins = program[pc]
+        pc = OPS[ins[0]](registers, pc, ins, output)
+        if ins[0] != OUT:
+            continue
 
-        pc += 1
+        state = (pc, len(output) % 2, *registers)
+        if output[-1] != (len(output) - 1) % 2 or state in failed:
+            failed.update(seen)
+            return False
+        if state in seen:
+            return True
+        seen.add(state)
 
-    return output
+    failed.update(seen)
+    return False
 
 
 def part_one(data: list) -> int:
+    # Compile once, outside the search over starting values
+    program = parse_instructions(data)
+    failed = set()
     for a in count(0):  # Infinite loop trying increasing values of 'a'
-        output = execute(data, a)
-        if all(output[i] == (i % 2) for i in range(len(output))):
+        if execute(program, a, failed):
             return a
     return -1
 
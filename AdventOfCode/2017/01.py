@@ -19,10 +19,8 @@ def part_one(data: list) -> int:
         int: The sum of all matching digits.
     """
 
-    return sum(
-        data[i] for i in range(len(data))
-        if data[i] == data[(i + 1) % len(data)]
-    )
+    # Pair each digit with the next one, wrapping the last to the first
+    return sum(a for a, b in zip(data, data[1:] + data[:1]) if a == b)
 
 
 def part_two(data: list) -> int:
@@ -41,7 +39,7 @@ def part_two(data: list) -> int:
     """
 
     half = len(data) // 2
-    return 2 * sum(data[i] for i in range(half) if data[i] == data[i + half])
+    return 2 * sum(a for a, b in zip(data[:half], data[half:]) if a == b)
 
 
 if __name__ == "__main__":
@@ -1,5 +1,7 @@
 #!/usr/bin/env python
 
+import numpy as np
+
 
 def read_puzzle_input() -> list:
     """
@@ -68,13 +70,14 @@ def part_two(data: list) -> int:
             # Total: 4 + 0 + 2 = 6
     """
 
-    checksum = []
+    checksum = 0
     for line in data:
-        for i in range(len(line)):
-            for j in range(len(line)):
-                if line[i] != line[j] and line[i] % line[j] == 0:
-                    checksum.append(line[i] // line[j])
-    return sum(checksum)
+        row = np.array(line, dtype=np.int64)
+        # Compare every value (rows) against every other value (columns)
+        dividend, divisor = row[:, None], row[None, :]
+        mask = (dividend != divisor) & (dividend % divisor == 0)
+        checksum += int((dividend // divisor)[mask].sum())
+    return checksum
 
 
 if __name__ == "__main__":
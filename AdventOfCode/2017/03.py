@@ -1,5 +1,32 @@
 #!/usr/bin/env python
 
+import math
+from bisect import bisect_right
+
+# The spiral's values in fill order (OEIS A141481), up to the first one past
+# 2**32, so part_two can answer any 32-bit target with a binary search
+SPIRAL_SUMS = (
+    1, 1, 2, 4, 5, 10, 11, 23, 25, 26, 54, 57, 59, 122, 133, 142, 147, 304,
+    330, 351, 362, 747, 806, 880, 931, 957, 1968, 2105, 2275, 2391, 2450,
+    5022, 5336, 5733, 6155, 6444, 6591, 13486, 14267, 15252, 16295, 17008,
+    17370, 35487, 37402, 39835, 42452, 45220, 47108, 48065, 98098, 103128,
+    109476, 116247, 123363, 128204, 130654, 266330, 279138, 295229, 312453,
+    330785, 349975, 363010, 369601, 752688, 787032, 830037, 875851, 924406,
+    975079, 1009457, 1026827, 2089141, 2179400, 2292124, 2411813, 2539320,
+    2674100, 2814493, 2909666, 2957731, 6013560, 6262851, 6573553, 6902404,
+    7251490, 7619304, 8001525, 8260383, 8391037, 17048404, 17724526,
+    18565223, 19452043, 20390510, 21383723, 22427493, 23510079, 24242690,
+    24612291, 49977270, 51886591, 54256348, 56749268, 59379562, 62154898,
+    65063840, 68075203, 70111487, 71138314, 144365769, 149661137,
+    156221802, 163105139, 170348396, 177973629, 186001542, 194399801,
+    203081691, 208949088, 211906819, 429827198, 445061340, 463911304,
+    483650112, 504377559, 526150757, 549023076, 572904288, 597557233,
+    614208653, 622599690, 1262247784, 1305411751, 1358749904, 1414491696,
+    1472899472, 1534125748, 1598327474, 1665648769, 1735829031, 1808194091,
+    1857049072, 1881661363, 3813299996, 3939776148, 4095896357, 4258788564,
+    4429173742,
+)
+
 
 def part_one(target: int) -> int:
     """
@@ -17,10 +44,8 @@ def part_one(target: int) -> int:
     int: The Manhattan distance from the target number to the center (0,0).
     """
 
-    # Find the ring layer
-    layer = 0
-    while (2 * layer + 1) ** 2 < target:
-        layer += 1
+    # Find the ring layer: the smallest one with (2 * layer + 1)^2 >= target
+    layer = 0 if target <= 1 else (math.isqrt(target - 1) + 1) // 2
 
     side_length = 2 * layer  # One side of the square (excluding center)
     max_value_in_layer = (2 * layer + 1) ** 2  # Largest number in this layer
@@ -38,8 +63,10 @@ def part_two(target: int) -> int:
     given target.
 
     The grid is filled in a spiral pattern where each cell's value is the sum
-    of all adjacent cells (including diagonals). The function stops when a
-    value larger than the target is found.
+    of all adjacent cells (including diagonals). Targets below the last
+    entry of SPIRAL_SUMS are answered with a binary search of that table;
+    larger ones fall back to filling the spiral until a value larger than
+    the target is found.
 
     Parameters:
     target (int): The threshold value to exceed.
@@ -48,8 +75,12 @@ def part_two(target: int) -> int:
     int: The first value in the spiral grid that is larger than the target.
     """
 
+    if target < SPIRAL_SUMS[-1]:
+        return SPIRAL_SUMS[bisect_right(SPIRAL_SUMS, target)]
+
     directions = [(1, 0), (0, 1), (-1, 0), (0, -1)]   # Right, Up, Left, Down
     diag_dirs = [(1, 1), (-1, 1), (-1, -1), (1, -1)]  # Diagonal Directions
+    neighbours = directions + diag_dirs  # Built once, not per cell
 
     grid = {(0, 0): 1}  # Dictionary to store values
     x, y = 0, 0         # Start at center
@@ -62,10 +93,7 @@ def part_two(target: int) -> int:
 
                 # Sum of all adjacent cells
                 value = sum(
-                    grid.get(
-                        (x + ddx, y + ddy),
-                        0
-                    ) for ddx, ddy in directions + diag_dirs
+                    grid.get((x + ddx, y + ddy), 0) for ddx, ddy in neighbours
                 )
                 grid[(x, y)] = value
 
@@ -1,26 +1,26 @@
 #!/usr/bin/env python
 
-import re
-
 
 def read_puzzle_input() -> list:
     """
     Reads the puzzle input from a file and returns a list of passphrases.
 
     The function opens the file "04.in" (which should contain one passphrase
-    per line), reads its contents, and splits them into a list of strings
-    (one per line).
+    per line), reads its contents, and splits them into a list of byte
+    strings (one per line). The passphrases are plain ASCII, so they are
+    kept as bytes, which skip decoding and are a little cheaper to split and
+    hash than str.
 
     Returns:
         list: A list where each element is a passphrase (a single line from
               the file).
     """
 
-    with open("04.in", "r") as file:
+    with open("04.in", "rb") as file:
         return file.read().splitlines()
 
 
-def is_valid(passphrase: str, sort: bool = False) -> bool:
+def is_valid(passphrase: bytes, sort: bool = False) -> bool:
     """
     Determines whether a given passphrase is valid according to the puzzle
     rules.
@@ -34,7 +34,7 @@ def is_valid(passphrase: str, sort: bool = False) -> bool:
       of each other.
 
     Args:
-        passphrase (str): The passphrase to validate.
+        passphrase (bytes): The passphrase to validate.
         sort (bool, optional): If True, checks for anagrams in addition to
                                duplicates. Defaults to False.
 
@@ -43,15 +43,21 @@ def is_valid(passphrase: str, sort: bool = False) -> bool:
     """
 
     words = passphrase.split()  # Split the passphrase into a list of words
+
+    # Ensure no duplicates (a repeated word is also an anagram of itself, so
+    # this settles Part 2 as well without sorting anything)
+    if len(words) != len(set(words)):
+        return False
+
     if sort:  # Part 2
-        # Normalize each word by sorting its characters (to detect anagrams)
-        sorted_words = [''.join(sorted(word)) for word in words]
+        # Normalize each word by sorting its characters (to detect anagrams);
+        # the sorted tuple of byte values is used as the key as it is
+        sorted_words = {tuple(sorted(word)) for word in words}
 
         # Ensure no duplicates
-        return len(sorted_words) == len(set(sorted_words))
+        return len(words) == len(sorted_words)
 
-    # Ensure no duplicates
-    return len(words) == len(set(words))
+    return True
 
 
 def part_one(data: list) -> int:
@@ -61,7 +67,7 @@ def part_one(data: list) -> int:
     A passphrase is valid if it contains no duplicate words.
 
     Args:
-        data (list): A list of passphrases (each passphrase is a string).
+        data (list): A list of passphrases (each one a byte string).
 
     Returns:
         int: The number of valid passphrases.
@@ -79,7 +85,7 @@ def part_two(data: list) -> int:
     are anagrams.
 
     Args:
-        data (list): A list of passphrases (each passphrase is a string).
+        data (list): A list of passphrases (each one a byte string).
 
     Returns:
         int: The number of valid passphrases under the new rules.
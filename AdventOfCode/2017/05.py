@@ -16,6 +16,18 @@ Part 2:
 
 from typing import List
 
+import numpy as np
+from numpy.typing import NDArray
+
+try:
+    from numba import njit
+    HAVE_NUMBA = True
+except ImportError:  # Without numba the loop below runs as plain Python
+    HAVE_NUMBA = False
+
+    def njit(**kwargs):
+        return lambda func: func
+
 
 def read_puzzle_input() -> List[int]:
     """
@@ -29,6 +41,58 @@ def read_puzzle_input() -> List[int]:
         return list(map(int, file.read().splitlines()))
 
 
+def make_offsets(data: List[int]):
+    """
+    Copies the offsets into the container count_steps runs fastest on.
+
+    The compiled loop needs a typed int32 array. When the loop runs as
+    plain Python, reading and writing numpy scalars one at a time is much
+    slower than working on a list (and array.array, which has to box every
+    value it hands back, is slower too), so it gets a plain list.
+
+    :param data: A list of integer offsets.
+    :return: A copy of the offsets for count_steps to modify.
+    """
+
+    if HAVE_NUMBA:
+        return np.array(data, dtype=np.int32)
+    return list(data)
+
+
+@njit(cache=True)
+def count_steps(offsets: NDArray[np.int32], limit: int) -> int:
+    """
+    Runs the jumps until they leave the list and counts them.
+
+    This is the hot loop of both parts (tens of millions of steps), so it is
+    compiled with numba: each step becomes a few native integer operations
+    on the int32 array instead of a round of interpreter bytecodes.
+
+    :param offsets: The jump offsets from make_offsets; modified in place.
+    :param limit: Offsets of at least this value are decreased after the
+                  jump, all others are increased.
+    :return: The number of steps required to exit the list.
+    """
+
+    steps = 0
+    index = 0
+    size = len(offsets)
+
+    while 0 <= index < size:        # Continue while within bounds
+        offset = offsets[index]     # Get the jump value
+
+        # Modify offset based on its value
+        if offset >= limit:
+            offsets[index] -= 1     # Decrease if at the limit or above
+        else:
+            offsets[index] += 1     # Otherwise, increase
+
+        index += offset             # Move to the new index
+        steps += 1                  # Count the step
+
+    return steps                    # Return the total number of steps taken
+
+
 def part_one(data: List[int]) -> int:
     """
     Solves Part 1 of the puzzle.
@@ -41,20 +105,12 @@ def part_one(data: List[int]) -> int:
     - Repeat until jumping out of bounds.
     - Return the total number of steps taken.
 
-    :param data: A list of integer offsets (a copy is recommended).
+    :param data: A list of integer offsets.
     :return: The number of steps required to exit the list.
     """
 
-    steps = 0
-    index = 0
-
-    while 0 <= index < len(data):   # Continue while within bounds
-        offset = data[index]        # Get the jump value
-        data[index] += 1            # Increase the offset before jumping
-        index += offset             # Move to the new index
-        steps += 1                  # Count the step
-
-    return steps                    # Return the total number of steps taken
+    # No offset ever reaches the int32 maximum, so every one is increased
+    return count_steps(make_offsets(data), np.iinfo(np.int32).max)
 
 
 def part_two(data: List[int]) -> int:
@@ -66,26 +122,11 @@ def part_two(data: List[int]) -> int:
     - Otherwise, increase it by 1 before jumping.
     - Return the number of steps required to exit the list.
 
-    :param data: A list of integer offsets (a copy is recommended).
+    :param data: A list of integer offsets.
     :return: The number of steps required to exit the list.
     """
 
-    steps = 0
-    index = 0
-
-    while 0 <= index < len(data):   # Continue while within bounds
-        offset = data[index]        # Get the jump value
-
-        # Modify offset based on its value
-        if offset >= 3:
-            data[index] -= 1        # Decrease if 3 or more
-        else:
-            data[index] += 1        # Otherwise, increase
-
-        index += offset             # Move to the new index
-        steps += 1                  # Count the step
-
-    return steps                    # Return the total number of steps taken
+    return count_steps(make_offsets(data), 3)
 
 
 if __name__ == "__main__":
@@ -15,72 +15,123 @@ Part 2:
   seen again.
 """
 
+from functools import lru_cache
 
-def part_one(data: list) -> int:
+
+def pack_banks(banks: list) -> tuple:
     """
-    Finds the number of redistribution cycles before a memory bank
-    configuration repeats.
+    Packs a memory bank configuration into a single integer.
+
+    Each bank gets a fixed-width bit field wide enough to hold every block
+    there is, so the packed value identifies the configuration exactly.
+    Hashing one int is much cheaper than building and hashing a 16-element
+    tuple on every cycle, and moving a block only needs one addition.
 
     Parameters:
-    data (list): A list of integers representing memory banks.
+    banks (list): A list of integers representing memory banks.
 
     Returns:
-    int: The number of redistribution cycles before a configuration repeats.
+    tuple: The packed configuration, and the value of one block in each
+           bank's field (add it to put a block in that bank).
     """
 
-    seen_configs = set()                    # Set to store seen configurations
-    banks = data[:]                         # Copy to avoid modifying original
-    steps = 0                               # Count redistribution cycles
+    width = sum(banks).bit_length()         # Bits per bank
+    units = [1 << (width * i) for i in range(len(banks))]
+    return sum(b * u for b, u in zip(banks, units)), units
 
-    while tuple(banks) not in seen_configs:
-        seen_configs.add(tuple(banks))      # Store the current configuration
-        steps += 1                          # Increment cycle counter
 
-        # Find the index of the first max value
-        max_blocks = max(banks)
-        idx = banks.index(max_blocks)       # Get first occurrence of max
+def redistribute(banks: list, units: list) -> int:
+    """
+    Performs one redistribution cycle in place.
 
-        banks[idx] = 0                      # Clear the max bank
+    Rather than handing out the blocks one at a time, the blocks are split
+    into whole passes around the banks (one block for every bank per pass)
+    and a remainder that goes to the banks right after the emptied one.
 
-        # Redistribute blocks cyclically
-        for _ in range(max_blocks):
-            idx = (idx + 1) % len(banks)    # Move to next index circularly
-            banks[idx] += 1
-    return steps                            # Return redistribution cycles
+    Parameters:
+    banks (list): A list of integers representing memory banks.
+    units (list): The per-bank field values from pack_banks.
 
+    Returns:
+    int: The change to the packed configuration.
+    """
 
-def part_two(data: list) -> int:
+    # Find the index of the first max value
+    max_blocks = max(banks)
+    idx = banks.index(max_blocks)           # Get first occurrence of max
+
+    banks[idx] = 0                          # Clear the max bank
+    delta = -max_blocks * units[idx]
+
+    full, extra = divmod(max_blocks, len(banks))
+    if full:                                # Every bank gets `full` blocks
+        banks[:] = [b + full for b in banks]
+        delta += full * sum(units)
+    for i in range(idx + 1, idx + 1 + extra):
+        i %= len(banks)                     # Move to next index circularly
+        banks[i] += 1
+        delta += units[i]
+    return delta
+
+
+@lru_cache(maxsize=1)
+def find_loop(data: tuple) -> tuple:
     """
-    Finds the cycle length of the infinite loop in memory bank redistribution.
+    Redistributes blocks until a memory bank configuration repeats.
+
+    Both parts come out of the same run, and the result is cached, so
+    part_one and part_two only simulate it once between them.
 
     Parameters:
-    data (list): A list of integers representing memory banks.
+    data (tuple): The memory banks (a tuple, so it can be cached).
 
     Returns:
-    int: The length of the loop that forms when a configuration repeats.
+    tuple: The number of redistribution cycles before a configuration
+           repeats, and the length of the loop it repeats in.
     """
 
     seen_configs = {}                       # Dictionary to store seen configs
-    banks = data[:]                         # Copy to avoid modifying original
+    banks = list(data)                      # Copy to avoid modifying original
+    state, units = pack_banks(banks)        # The configuration as one int
     steps = 0                               # Count total redistribution cycles
 
-    while tuple(banks) not in seen_configs:
-        seen_configs[tuple(banks)] = steps  # Store config w/ its step count
+    while state not in seen_configs:
+        seen_configs[state] = steps         # Store config w/ its step count
         steps += 1                          # Increment step count
 
-        # Find the index of the first max value
-        max_blocks = max(banks)
-        idx = banks.index(max_blocks)       # Get first occurrence of max
+        state += redistribute(banks, units)  # Redistribute the max bank
 
-        banks[idx] = 0                      # Clear the max bank
+    # Loop Size = Current Step Count - First Occurrence Step Count
+    return steps, steps - seen_configs[state]
 
-        # Redistribute blocks cyclically
-        for _ in range(max_blocks):
-            idx = (idx + 1) % len(banks)    # Move to next index circularly
-            banks[idx] += 1
 
-    # Loop Size = Current Step Count - First Occurrence Step Count
-    return steps - seen_configs[tuple(banks)]
+def part_one(data: list) -> int:
+    """
+    Finds the number of redistribution cycles before a memory bank
+    configuration repeats.
+
+    Parameters:
+    data (list): A list of integers representing memory banks.
+
+    Returns:
+    int: The number of redistribution cycles before a configuration repeats.
+    """
+
+    return find_loop(tuple(data))[0]
+
+
+def part_two(data: list) -> int:
+    """
+    Finds the cycle length of the infinite loop in memory bank redistribution.
+
+    Parameters:
+    data (list): A list of integers representing memory banks.
+
+    Returns:
+    int: The length of the loop that forms when a configuration repeats.
+    """
+
+    return find_loop(tuple(data))[1]
 
 
 if __name__ == "__main__":
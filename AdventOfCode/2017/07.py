@@ -1,8 +1,12 @@
 #!/usr/bin/env python
 
+import re
 from collections import defaultdict
 from typing import Optional, Tuple
 
+# A program line: name, weight and an optional list of children
+LINE = re.compile(r'(\w+) \((\d+)\)(?: -> (.*))?')
+
 
 def read_puzzle_input() -> list:
     """
@@ -36,22 +40,22 @@ def parse_input(data: list) -> tuple[dict, dict]:
     tree = {}
     weights = {}
     for line in data:
-        parts = line.split()
-        name = parts[0]
-        weight = int(parts[1].strip('()'))
-        children = []
-        if '->' in line:
-            children = [part.strip(',') for part in parts[3:]]
-        tree[name] = children
-        weights[name] = weight
+        # One match picks out all three fields
+        name, weight, children = LINE.match(line).groups()
+        tree[name] = children.split(', ') if children else []
+        weights[name] = int(weight)
     return tree, weights
 
 
 def calculate_total_weights(node: str, tree: dict, weights: dict,
                             total_weights: dict) -> int:
     """
-    Recursively calculates the total weight of a program, including its
-    children.
+    Calculates the total weight of a program, including its children.
+
+    The tower is walked in post-order with an explicit stack rather than by
+    recursion, so each program's total is filled in once all of its
+    children's totals are known, with no call frame per program and no
+    limit on the depth of the tower.
 
     Args:
         node (str): The name of the program to calculate the total weight for.
@@ -64,13 +68,21 @@ def calculate_total_weights(node: str, tree: dict, weights: dict,
         int: The total weight of the program and its children.
     """
 
-    if node in total_weights:
-        return total_weights[node]
-    total = weights[node]
-    for child in tree[node]:
-        total += calculate_total_weights(child, tree, weights, total_weights)
-    total_weights[node] = total
-    return total
+    stack = [(node, False)]  # Stores (program, children already pushed)
+    while stack:
+        current, expanded = stack.pop()
+        if current in total_weights:
+            continue
+        if expanded:
+            # All children are done, so this program's total is ready
+            total_weights[current] = weights[current] + sum(
+                total_weights[child] for child in tree[current]
+            )
+        else:
+            # Revisit this program after its children have been totalled
+            stack.append((current, True))
+            stack.extend((child, False) for child in tree[current])
+    return total_weights[node]
 
 
 def find_unbalanced_node(node: str, tree: dict, total_weights: dict,
@@ -79,6 +91,10 @@ def find_unbalanced_node(node: str, tree: dict, total_weights: dict,
     Finds the unbalanced program in the tree and calculates the required
     weight adjustment.
 
+    The search walks down from `node` through each unbalanced child in a
+    loop, one step per level, until it reaches a node whose children are
+    balanced.
+
     Args:
         node (str): The name of the program to start searching from.
         tree (dict): The tree structure (program -> list of children).
@@ -93,45 +109,42 @@ def find_unbalanced_node(node: str, tree: dict, total_weights: dict,
             If the tree is balanced, returns None.
     """
 
-    children = tree[node]
-    if not children:
-        return None
-
-    # Group children by their total weights
-    weight_counts = defaultdict(list)
-    for child in children:
-        weight_counts[total_weights[child]].append(child)
-
-    # If all children have the same weight, this node is balanced
-    if len(weight_counts) == 1:
-        return None
-
-    # Find the unbalanced child
-    unbalanced_weight = 0
-    unbalanced_node = ''
-    for weight, nodes in weight_counts.items():
-        if len(nodes) == 1:
-            unbalanced_weight = weight
-            unbalanced_node = nodes[0]
-            break
-
-    # Check if the unbalanced node's children are balanced
-    if (find_unbalanced_node(
-            unbalanced_node, tree, total_weights, weights) is not None):
-        return find_unbalanced_node(unbalanced_node, tree,
-                                    total_weights, weights)
-
-    # Calculate the correct weight for the unbalanced node
-    correct_weight = 0
-    for weight in weight_counts:
-        if weight != unbalanced_weight:
-            correct_weight = weight
-            break
-
-    # Calculate the required adjustment
-    required_weight = weights[unbalanced_node] \
-        + (correct_weight - unbalanced_weight)
-    return (unbalanced_node, required_weight)
+    result = None
+    while True:
+        children = tree[node]
+        if not children:
+            return result
+
+        # Group children by their total weights
+        weight_counts = defaultdict(list)
+        for child in children:
+            weight_counts[total_weights[child]].append(child)
+
+        # If all children have the same weight, this node is balanced, so
+        # the deepest imbalance found on the way down is the culprit
+        if len(weight_counts) == 1:
+            return result
+
+        # Find the unbalanced child
+        unbalanced_weight = 0
+        unbalanced_node = ''
+        for weight, nodes in weight_counts.items():
+            if len(nodes) == 1:
+                unbalanced_weight = weight
+                unbalanced_node = nodes[0]
+                break
+
+        # Calculate the correct weight for the unbalanced node
+        correct_weight = next(
+            weight for weight in weight_counts if weight != unbalanced_weight
+        )
+
+        # Record the required adjustment, then check whether the unbalanced
+        # node's own children are balanced
+        required_weight = weights[unbalanced_node] \
+            + (correct_weight - unbalanced_weight)
+        result = (unbalanced_node, required_weight)
+        node = unbalanced_node
 
 
 def part_one(data: list) -> int:
@@ -1,18 +1,19 @@
 #!/usr/bin/env python
 
 import operator
-from collections import defaultdict
+from functools import lru_cache
 
-# Dictionary mapping comparison operators to their
-# corresponding Python functions
-OPS = {
-    '>': operator.gt,   # Greater than
-    '>=': operator.ge,  # Greater than or equal to
-    '<': operator.lt,   # Less than
-    '<=': operator.le,  # Less than or equal to
-    '==': operator.eq,  # Equal to
-    '!=': operator.ne   # Not equal to
-}
+# The comparison operators, in opcode order, and the Python functions
+# that evaluate them (indexed by opcode)
+COMPARISONS = ['>', '>=', '<', '<=', '==', '!=']
+OPS = [
+    operator.gt,   # Greater than
+    operator.ge,   # Greater than or equal to
+    operator.lt,   # Less than
+    operator.le,   # Less than or equal to
+    operator.eq,   # Equal to
+    operator.ne    # Not equal to
+]
 
 
 def read_puzzle_input() -> list:
@@ -28,6 +29,76 @@ def read_puzzle_input() -> list:
         return file.read().splitlines()
 
 
+def parse_instructions(data: tuple) -> tuple:
+    """
+    Compiles the instructions once, before they are run.
+
+    Each instruction becomes (reg, delta, if_reg, op, val): registers are
+    numbered in order of first appearance so they can live in a list, inc
+    and dec are folded into the sign of delta, and the comparison is an
+    opcode into OPS.
+
+    Args:
+        data (tuple): The instructions as strings.
+
+    Returns:
+        tuple: The compiled program and the number of registers.
+    """
+
+    names = {}  # Register name -> index
+    program = []
+    for line in data:
+        reg, cmd, offset, _, if_reg, op, val = line.split()
+        delta = int(offset) if cmd == 'inc' else -int(offset)
+        program.append((
+            names.setdefault(reg, len(names)), delta,
+            names.setdefault(if_reg, len(names)),
+            COMPARISONS.index(op), int(val)
+        ))
+    return program, len(names)
+
+
+@lru_cache(maxsize=1)
+def execute(data: tuple) -> tuple:
+    """
+    Executes the instructions once, tracking both the final register values
+    and the highest value any register held along the way.
+
+    The result is cached, so part_one and part_two share a single run.
+
+    Args:
+        data (tuple): The instructions as strings (a tuple, so it can be
+                      cached).
+
+    Returns:
+        tuple: The highest value in any register at the end, and the
+               highest value any register held during execution.
+    """
+
+    program, size = parse_instructions(data)
+
+    # Register values, initialized to 0, and which of them have been used
+    # (read by a condition or modified), as only those count at the end
+    registers = [0] * size
+    used = [False] * size
+
+    # Variable to track the highest value ever held by any register
+    max_reg_val = 0
+
+    for reg, delta, if_reg, op, val in program:
+        used[if_reg] = True
+
+        # Check the condition: if true, modify the target register
+        if OPS[op](registers[if_reg], val):
+            registers[reg] += delta
+            used[reg] = True
+            # Update the maximum value ever held in any register
+            max_reg_val = max(max_reg_val, registers[reg])
+
+    final_max = max(value for value, seen in zip(registers, used) if seen)
+    return final_max, max_reg_val
+
+
 def part_one(data: list) -> int:
     """
     Executes the instructions and returns the maximum value in any register
@@ -45,20 +116,7 @@ def part_one(data: list) -> int:
         int: The highest value in any register at the end of execution.
     """
 
-    # Dictionary to store register values, initialized to 0
-    registers = defaultdict(int)
-
-    for line in data:
-        # Parse the instruction components
-        reg, cmd, offset, _, if_reg, op, val = line.split()
-        offset, val = int(offset), int(val)  # Convert values to integers
-
-        # Check the condition: if true, modify the target register
-        if OPS[op](registers[if_reg], val):
-            registers[reg] += offset if cmd == 'inc' else -offset
-
-    # Return the maximum value found in any register
-    return max(registers.values())
+    return execute(tuple(data))[0]
 
 
 def part_two(data: list) -> int:
@@ -78,25 +136,7 @@ def part_two(data: list) -> int:
         int: The highest value any register held during execution.
     """
 
-    # Dictionary to store register values, initialized to 0
-    registers = defaultdict(int)
-
-    # Variable to track the highest value ever held by any register
-    max_reg_val = 0
-
-    for line in data:
-        # Parse the instruction components
-        reg, cmd, offset, _, if_reg, op, val = line.split()
-        offset, val = int(offset), int(val)  # Convert values to integers
-
-        # Check the condition: if true, modify the target register
-        if OPS[op](registers[if_reg], val):
-            registers[reg] += offset if cmd == 'inc' else -offset
-            # Update the maximum value ever held in any register
-            max_reg_val = max(max_reg_val, registers[reg])
-
-    # Return the highest value recorded at any point during execution
-    return max_reg_val
+    return execute(tuple(data))[1]
 
 
 if __name__ == "__main__":
@@ -13,6 +13,15 @@ Functions:
                    processed stream.
 """
 
+import re
+from functools import lru_cache
+
+# A '!' and the character it cancels
+CANCELLED = re.compile(r'!.', re.DOTALL)
+
+# A piece of garbage (once cancelled characters are gone)
+GARBAGE = re.compile(r'<[^>]*>')
+
 
 def read_puzzle_input() -> str:
     # Read input from file
@@ -20,10 +29,17 @@ def read_puzzle_input() -> str:
         return file.read().strip()
 
 
+@lru_cache(maxsize=1)
 def process_stream(stream: str):
     """
     Parses the input stream and calculates the total score of nested groups
-    and the number of garbage characters.
+    and the number of garbage characters. The result is cached, as both
+    parts ask for it.
+
+    Most of the work is done by regular expressions rather than a Python
+    loop over every character. '!' only ever appears inside garbage, so the
+    cancelled pairs are removed first; the garbage is then stripped out and
+    counted by length. All that is left to walk is the braces.
 
     Parameters:
         stream (str): The input character stream.
@@ -32,32 +48,20 @@ def process_stream(stream: str):
         tuple: (total_score, garbage_count)
     """
 
+    clean = CANCELLED.sub('', stream)
+    groups, pieces = GARBAGE.subn('', clean)
+
+    # Everything removed is garbage, apart from each piece's '<' and '>'
+    garbage_count = len(clean) - len(groups) - 2 * pieces
+
     total_score = 0
-    garbage_count = 0
     depth = 0
-    in_garbage = False
-    ignore_next = False
-
-    for char in stream:
-        if ignore_next:
-            ignore_next = False
-            continue
-
-        if in_garbage:
-            if char == '>':  # End of garbage
-                in_garbage = False
-            elif char == '!':  # Ignore next character
-                ignore_next = True
-            else:
-                garbage_count += 1  # Count garbage characters
-        else:
-            if char == '{':  # Start a new group
-                depth += 1
-                total_score += depth
-            elif char == '}':  # Close a group
-                depth -= 1
-            elif char == '<':  # Start garbage collection
-                in_garbage = True
+    for char in groups.replace(',', ''):
+        if char == '{':  # Start a new group
+            depth += 1
+            total_score += depth
+        else:  # Close a group
+            depth -= 1
 
     return total_score, garbage_count
 
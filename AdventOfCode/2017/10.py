@@ -14,20 +14,28 @@ Usage:
 
 from typing import List
 
+import numpy as np
+from numpy.typing import NDArray
 
-def knot_hash(numbers: List[int], lengths: List[int],
-              rounds: int = 1) -> List[int]:
+
+def knot_hash(numbers: NDArray[np.uint8], lengths: List[int],
+              rounds: int = 1) -> NDArray[np.uint8]:
     """
     Performs the Knot Hash scrambling process on a circular list.
 
+    Each section is reversed with numpy slices rather than element by
+    element. A section that wraps past the end is gathered from its two
+    pieces, reversed, and split back across them.
+
     Args:
-        numbers (List[int]): The initial list of numbers to be scrambled.
+        numbers (NDArray[np.uint8]): The initial numbers to be scrambled;
+                                     modified in place.
         lengths (List[int]): The sequence of lengths used to modify the list.
         rounds (int, optional): Number of times to repeat the process.
                                 Defaults to 1.
 
     Returns:
-        List[int]: The modified list after processing all lengths.
+        NDArray[np.uint8]: The modified list after processing all lengths.
     """
 
     pos = 0  # Current position in the list
@@ -36,44 +44,42 @@ def knot_hash(numbers: List[int], lengths: List[int],
 
     for _ in range(rounds):
         for length in lengths:
-            # Extract and reverse the section of the list, handling wraparound
-            rev_section = [numbers[(pos + i) % n] for i in range(length)]
-            rev_section.reverse()
-
-            # Write the reversed section back into the list
-            for i in range(length):
-                numbers[(pos + i) % n] = rev_section[i]
+            end = pos + length
+            if end <= n:
+                # The section is contiguous, so reverse it in place
+                numbers[pos:end] = numbers[pos:end][::-1]
+            else:
+                # Reverse the wrapped section, then write back both pieces
+                wrap = end - n
+                section = np.concatenate((numbers[pos:], numbers[:wrap]))
+                section = section[::-1]
+                numbers[pos:] = section[:n - pos]
+                numbers[:wrap] = section[n - pos:]
 
             # Move forward in the list, adjusting for wraparound
-            pos = (pos + length + skip) % n
+            pos = (end + skip) % n
             skip += 1  # Increment skip size
 
     return numbers
 
 
-def compute_dense_hash(scrambled: List[int]) -> List[int]:
+def compute_dense_hash(scrambled: NDArray[np.uint8]) -> NDArray[np.uint8]:
     """
     Computes the dense hash from a scrambled list.
 
     The dense hash is computed by taking 16-byte blocks and XOR-ing all
-    elements within each block.
+    elements within each block, done here as one XOR reduction over the
+    rows of a 16x16 view.
 
     Args:
-        scrambled (List[int]): The list of 256 numbers after 64 rounds of
-                               scrambling.
+        scrambled (NDArray[np.uint8]): The 256 numbers after 64 rounds of
+                                       scrambling.
 
     Returns:
-        List[int]: A list of 16 numbers (each rep a block's XOR result).
+        NDArray[np.uint8]: 16 numbers (each rep a block's XOR result).
     """
 
-    dense_hash = []
-    for i in range(0, 256, 16):  # Process in blocks of 16
-        xor_result = scrambled[i]
-        for j in range(1, 16):
-            xor_result ^= scrambled[i + j]  # XOR each value in the block
-        dense_hash.append(xor_result)
-
-    return dense_hash
+    return np.bitwise_xor.reduce(scrambled.reshape(16, 16), axis=1)
 
 
 def part_one(data: str) -> int:
@@ -91,7 +97,7 @@ def part_one(data: str) -> int:
     """
 
     # Initialize the list with values from 0 to 255
-    numbers = list(range(256))
+    numbers = np.arange(256, dtype=np.uint8)
 
     # Convert input string to a list of integers
     lengths = list(map(int, data.split(',')))
@@ -99,8 +105,9 @@ def part_one(data: str) -> int:
     # Apply the Knot Hash algorithm
     scrambled = knot_hash(numbers, lengths)
 
-    # Multiply the first 2 numbers and return the product
-    return scrambled[0] * scrambled[1]
+    # Multiply the first 2 numbers and return the product (as Python ints,
+    # since the product doesn't fit in a uint8)
+    return int(scrambled[0]) * int(scrambled[1])
 
 
 def part_two(data: str) -> str:
@@ -122,7 +129,7 @@ def part_two(data: str) -> str:
     """
 
     # Initialize the list with values from 0 to 255
-    numbers = list(range(256))
+    numbers = np.arange(256, dtype=np.uint8)
 
     # Convert input to ASCII + suffix
     lengths = [ord(c) for c in data] + [17, 31, 73, 47, 23]
@@ -133,8 +140,8 @@ def part_two(data: str) -> str:
     # Compute dense hash
     dense_hash = compute_dense_hash(scrambled)
 
-    # Convert to a hex string and return
-    return ''.join(f'{x:02x}' for x in dense_hash)
+    # Convert to a hex string (in one go, from the raw bytes) and return
+    return dense_hash.tobytes().hex()
 
 
 if __name__ == "__main__":
@@ -1,5 +1,21 @@
 #!/usr/bin/env python
 
+from functools import lru_cache
+
+import numpy as np
+
+# Movement directions, and the coordinate changes they make in axial
+# coordinates (indexed by the direction's number)
+DIRECTIONS = {"n": 0, "s": 1, "ne": 2, "nw": 3, "se": 4, "sw": 5}
+DELTAS = np.array([
+    (0, -1),   # n
+    (0, 1),    # s
+    (1, -1),   # ne
+    (-1, 0),   # nw
+    (1, 0),    # se
+    (-1, 1)    # sw
+], dtype=np.int8)
+
 
 def read_puzzle_input() -> list:
     """
@@ -14,46 +30,44 @@ def read_puzzle_input() -> list:
         return file.read().strip().split(',')
 
 
-def hex_distance(steps: list) -> tuple[int, int]:
+@lru_cache(maxsize=1)
+def hex_distance(steps: tuple) -> tuple[int, int]:
     """
     Calculates the final distance from the starting point and the maximum
     distance reached at any point while following a series of steps in a
     hexagonal grid.
 
-    Uses cube coordinates (x, y, z) to track movement.
+    Uses axial coordinates (q, r) to track movement: the third cube
+    coordinate is always -(q + r), so the distance from the origin is
+    (|q| + |r| + |q + r|) / 2. Every position along the path comes from a
+    single cumulative sum over the step deltas, and the distances are
+    worked out for all of them at once.
 
     Args:
-        steps (list): A list of movement directions as strings.
+        steps (tuple): The movement directions as strings (a tuple, so the
+                       result can be cached for the second part).
 
     Returns:
         tuple[int, int]: A tuple containing:
             - The final distance from the starting point.
             - The maximum distance reached at any point during the path.
     """
-    # Mapping of movement directions to coordinate changes in cube coordinates
-    moves = {
-        "n":  (0, 1, -1),
-        "s":  (0, -1, 1),
-        "ne": (1, 0, -1),
-        "nw": (-1, 1, 0),
-        "se": (1, -1, 0),
-        "sw": (-1, 0, 1)
-    }
-
-    # Initialize coordinates at the origin
-    x = y = z = 0
-    # Track the maximum distance reached during the path
-    max_distance = 0
-
-    # Process each step in the input list
-    for step in steps:
-        dx, dy, dz = moves[step]  # Get coordinate change for the step
-        x, y, z = x + dx, y + dy, z + dz  # Update position
-        # Update max distance
-        max_distance = max(max_distance, max(abs(x), abs(y), abs(z)))
-
-    # Compute final distance from the origin
-    return max(abs(x), abs(y), abs(z)), max_distance
+    # Encode the directions as indices into DELTAS, then look up all the
+    # coordinate changes with one fancy index
+    indices = np.fromiter(
+        (DIRECTIONS[step] for step in steps), dtype=np.uint8, count=len(steps)
+    )
+    deltas = DELTAS[indices]
+
+    # Position after every step
+    positions = np.cumsum(deltas, axis=0, dtype=np.int64)
+    q, r = positions[:, 0], positions[:, 1]
+
+    # Distance from the origin after every step
+    distances = (np.abs(q) + np.abs(r) + np.abs(q + r)) // 2
+
+    # Final distance from the origin, and the furthest it ever got
+    return int(distances[-1]), int(distances.max())
 
 
 def part_one(data: list) -> int:
@@ -67,7 +81,7 @@ def part_one(data: list) -> int:
     Returns:
         int: The final distance from the start.
     """
-    return hex_distance(data)[0]
+    return hex_distance(tuple(data))[0]
 
 
 def part_two(data: list) -> int:
@@ -81,7 +95,7 @@ def part_two(data: list) -> int:
     Returns:
         int: The maximum distance reached.
     """
-    return hex_distance(data)[1]
+    return hex_distance(tuple(data))[1]
 
 
 if __name__ == "__main__":
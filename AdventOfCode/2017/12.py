@@ -3,48 +3,56 @@
 from collections import deque
 
 
-def read_puzzle_input() -> dict:
+def read_puzzle_input() -> list:
     """
-    Parses the input text into a dictionary where each key is a program ID
-    and the value is a set of directly connected program IDs.
+    Parses the input text into an adjacency list: entry i is the list of
+    program IDs directly connected to program i.
+
+    The input lists the programs in ID order from 0 upwards, so each
+    program's neighbours can be found by list index rather than a dict
+    lookup, and the searches below can mark visited programs in a bytearray
+    instead of a set.
     """
 
-    data = {}
+    data = []
     with open("12.in", "r") as file:
         for line in file.read().splitlines():
-            program, connections = line.split(' <-> ')
-            data[int(program)] = set(map(int, connections.split(', ')))
+            _, connections = line.split(' <-> ')
+            data.append(list(map(int, connections.split(', '))))
         return data
 
 
-def bfs(data: dict, start: int) -> set:
+def bfs(data: list, start: int, visited: bytearray) -> int:
     """
-    Performs a breadth-first search (BFS) starting from a given node
-    and returns all nodes that are reachable from that starting node.
+    Performs a breadth-first search (BFS) starting from a given node,
+    marking every node reachable from it in `visited`, and returns how
+    many nodes were newly reached.
     """
 
     queue = deque([start])
-    visited = set()
+    visited[start] = 1
+    size = 0
     while queue:
         node = queue.popleft()
-        if node not in visited:
-            visited.add(node)
-            queue.extend(data[node] - visited)  # Add unvisited neighbors
-    return visited
+        size += 1
+        for neighbour in data[node]:
+            if not visited[neighbour]:  # Add unvisited neighbors
+                visited[neighbour] = 1
+                queue.append(neighbour)
+    return size
 
 
-def part_one(data: dict) -> int:
-    return len(bfs(data, 0))
+def part_one(data: list) -> int:
+    return bfs(data, 0, bytearray(len(data)))
 
 
-def part_two(data: dict) -> int:
-    visited = set()
+def part_two(data: list) -> int:
+    visited = bytearray(len(data))
     groups = 0
 
-    for node in data:
-        if node not in visited:
-            group = bfs(data, node)
-            visited.update(group)
+    for node in range(len(data)):
+        if not visited[node]:
+            bfs(data, node, visited)
             groups += 1
 
     return groups
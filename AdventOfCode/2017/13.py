@@ -27,6 +27,11 @@ This means:
 - Layer 6 has a scanner with range 4
 """
 
+from math import lcm
+
+# The most residues part two keeps in its wheel of allowed delays
+WHEEL_LIMIT = 50_000
+
 
 def read_puzzle_input() -> dict:
     with open("13.in", "r") as file:
@@ -120,19 +125,46 @@ def find_safe_delay(firewall):
         int: Minimum delay needed to pass safely
     """
 
-    delay = 0
+    # Only whether a scanner is at the top matters, which happens exactly
+    # when the time is a multiple of its cycle, so each layer rules out one
+    # residue class of delays. Starting from the shortest cycles, the layers
+    # are folded into a wheel: the residues, modulo the lcm of their cycles,
+    # that none of them rule out. That stops once the wheel would grow too
+    # large, and only delays on the wheel are tried against the rest
+    layers = sorted((2 * (range_size - 1), depth)
+                    for depth, range_size in firewall.items())
+
+    modulus = 1
+    allowed = [0]
+    rest = []
+    for i, (cycle, depth) in enumerate(layers):
+        wider = lcm(modulus, cycle)
+        if len(allowed) * (wider // modulus) > WHEEL_LIMIT:
+            rest = layers[i:]
+            break
+
+        # Spread the residues over the wider modulus, keeping the ones this
+        # layer doesn't catch
+        allowed = sorted(
+            delay
+            for base in range(0, wider, modulus)
+            for delay in (base + residue for residue in allowed)
+            if (delay + depth) % cycle
+        )
+        modulus = wider
+
+    base = 0
     while True:
-        # Check if we can pass safely with this delay
-        caught = False
-        for depth, range_size in firewall.items():
-            time = depth + delay
-            if scanner_position(time, range_size) == 0:
-                caught = True
-                break
-
-        if not caught:
-            return delay
-        delay += 1
+        for residue in allowed:
+            delay = base + residue
+
+            # Check if we can pass the remaining layers with this delay
+            for cycle, depth in rest:
+                if (depth + delay) % cycle == 0:
+                    break  # Caught
+            else:
+                return delay
+        base += modulus
 
 
 def part_one(data: dict) -> int:
@@ -19,13 +19,16 @@ Key Algorithms Used:
    - A graph traversal algorithm that determines and labels connected regions
    - Uses Depth-First Search (DFS) for region exploration
    - Time Complexity: O(n), where n is the number of cells
-   - Space Complexity: O(n) for the recursion stack
+   - Space Complexity: O(n) for the search stack
 
 3. Connected Components (conceptual basis for Part 2)
    - Graph theory concept for finding connected subgraphs
    - In this case, used to identify contiguous regions of used disk space
 """
 
+import numpy as np
+from numpy.typing import NDArray
+
 
 def knot_hash(input_string):
     """
@@ -42,6 +45,10 @@ def knot_hash(input_string):
     2. Perform 64 rounds of list manipulation
     3. Compute dense hash through XOR operations
     4. Convert to hexadecimal
+
+    Each section is reversed with a single slice assignment; one that wraps
+    past the end is gathered from its two pieces first. The dense hash is a
+    numpy XOR reduction over the rows of a 16x16 view.
     """
 
     # Convert input to ASCII and add standard suffix
@@ -49,43 +56,38 @@ def knot_hash(input_string):
 
     # Initialize circular list of numbers 0-255
     numbers = list(range(256))
+    size = len(numbers)
     current_pos = 0
     skip_size = 0
 
     # Perform 64 rounds of the knot tying process
     for _ in range(64):
         for length in lengths:
-            # Handle list reversal, including wrap-around cases
-            if length <= len(numbers):
-                end_pos = (current_pos + length) % len(numbers)
-                if end_pos > current_pos:
-                    numbers[current_pos:end_pos] = reversed(
-                                                numbers[current_pos:end_pos])
-                else:
-                    to_reverse = numbers[current_pos:] + numbers[:end_pos]
-                    reversed_portion = list(reversed(to_reverse))
-                    numbers[current_pos:] = reversed_portion[:len(
-                                                        numbers)-current_pos]
-                    numbers[:end_pos] = reversed_portion[len(
-                                                        numbers)-current_pos:]
+            end_pos = current_pos + length
+            if end_pos <= size:
+                # The section is contiguous, so reverse it in place
+                numbers[current_pos:end_pos] = \
+                    numbers[current_pos:end_pos][::-1]
+            else:
+                # Reverse the wrapped section, then write back both pieces
+                wrap = end_pos - size
+                section = (numbers[current_pos:] + numbers[:wrap])[::-1]
+                numbers[current_pos:] = section[:size - current_pos]
+                numbers[:wrap] = section[size - current_pos:]
 
             # Update position and skip size
-            current_pos = (current_pos + length + skip_size) % len(numbers)
+            current_pos = (end_pos + skip_size) % size
             skip_size += 1
 
-    # Compute dense hash through XOR operations
-    dense_hash = []
-    for i in range(0, 256, 16):
-        xor_result = 0
-        for j in range(16):
-            xor_result ^= numbers[i + j]
-        dense_hash.append(xor_result)
+    # Compute dense hash through XOR operations, one per block of 16
+    dense_hash = np.bitwise_xor.reduce(
+        np.array(numbers, dtype=np.uint8).reshape(16, 16), axis=1)
 
     # Convert to hexadecimal
-    return ''.join([format(x, '02x') for x in dense_hash])
+    return dense_hash.tobytes().hex()
 
 
-def create_disk_grid(puzzle_input):
+def create_disk_grid(puzzle_input) -> NDArray[np.uint8]:
     """
     Creates a 128x128 grid representing disk usage.
 
@@ -93,102 +95,111 @@ def create_disk_grid(puzzle_input):
         puzzle_input (str): The puzzle input string
 
     Returns:
-        list: 2D list representing disk grid where '1' represents used squares
+        NDArray[np.uint8]: 128x128 array representing the disk grid, where
+                           1 represents a used square
 
     Process:
     1. Generate 128 different knot hashes
-    2. Convert each hash to binary
-    3. Create grid rows from binary strings
+    2. Convert each hash to its 16 raw bytes
+    3. Unpack the bytes into the row's 128 bits
     """
 
-    grid = []
-    for row in range(128):
-        # Create input string for this row
-        row_input = f"{puzzle_input}-{row}"
+    # Create the input string for each row, and hash them all
+    row_inputs = [f"{puzzle_input}-{row}" for row in range(128)]
+    hashes = list(map(knot_hash, row_inputs))
 
-        # Get knot hash and convert to binary
-        hash_result = knot_hash(row_input)
-        binary = bin(int(hash_result, 16))[2:].zfill(128)
+    # Unpack each hash's bits (most significant first) into its row
+    hash_bytes = bytes.fromhex(''.join(hashes))
+    bits = np.unpackbits(np.frombuffer(hash_bytes, dtype=np.uint8))
+    return bits.reshape(128, 128)
 
-        # Add row to grid
-        grid.append(list(binary))
-    return grid
 
-
-def flood_fill(grid, row, col, visited):
+def flood_fill(grid, start, visited):
     """
-    Implements flood fill algorithm using recursive DFS to mark connected
+    Implements flood fill algorithm using an iterative DFS to mark connected
     regions.
 
     Args:
-        grid (list): 2D list representing the disk grid
-        row (int): Current row position
-        col (int): Current column position
-        visited (set): Set of visited coordinates
+        grid (bytes): The disk grid flattened row by row, one byte per cell
+        start (int): Index of the cell to start from (row * 128 + col)
+        visited (bytearray): Visited flags, one per cell
 
     Algorithm:
-    - Uses Depth-First Search to explore connected '1' cells
-    - Marks visited cells to avoid cycles
+    - Uses Depth-First Search with an explicit stack, so a large region
+      can't exhaust the recursion limit
+    - Marks cells as visited when they are pushed, so each is pushed once
     - Checks only orthogonal connections (up, down, left, right)
     """
 
-    # Check bounds and validity of cell
-    if (row < 0 or row >= 128 or
-        col < 0 or col >= 128 or
-        grid[row][col] == '0' or
-            (row, col) in visited):
-        return
-
-    # Mark current cell as visited
-    visited.add((row, col))
-
-    # Recursively check all four adjacent cells
-    # This creates a flood fill effect, marking all connected cells
-    flood_fill(grid, row + 1, col, visited)  # down
-    flood_fill(grid, row - 1, col, visited)  # up
-    flood_fill(grid, row, col + 1, visited)  # right
-    flood_fill(grid, row, col - 1, visited)  # left
-
-
-def part_one(data: list) -> int:
+    stack = [start]
+    visited[start] = 1
+    while stack:
+        idx = stack.pop()
+        col = idx % 128
+
+        # Push each used, unvisited neighbour that is inside the grid
+        if idx < 127 * 128:  # down
+            n = idx + 128
+            if grid[n] and not visited[n]:
+                visited[n] = 1
+                stack.append(n)
+        if idx >= 128:  # up
+            n = idx - 128
+            if grid[n] and not visited[n]:
+                visited[n] = 1
+                stack.append(n)
+        if col < 127:  # right
+            n = idx + 1
+            if grid[n] and not visited[n]:
+                visited[n] = 1
+                stack.append(n)
+        if col > 0:  # left
+            n = idx - 1
+            if grid[n] and not visited[n]:
+                visited[n] = 1
+                stack.append(n)
+
+
+def part_one(data: NDArray[np.uint8]) -> int:
     """
     Counts total number of used squares (Part 1).
 
     Args:
-        grid (list): 2D list representing the disk grid
+        data (NDArray[np.uint8]): The disk grid
 
     Returns:
         int: Total number of used squares
     """
 
-    return sum(row.count('1') for row in data)
+    return int(np.count_nonzero(data))
 
 
-def part_two(data: list) -> int:
+def part_two(data: NDArray[np.uint8]) -> int:
     """
     Counts number of distinct regions (Part 2).
 
     Args:
-        data (list): 2D list representing the disk grid
+        data (NDArray[np.uint8]): The disk grid
 
     Returns:
         int: Number of distinct regions
 
     Algorithm:
     - Uses flood fill to identify and count connected regions
-    - Each unvisited '1' cell represents the start of a new region
+    - Each unvisited used cell represents the start of a new region
     """
 
-    visited = set()
+    # Bytes are much quicker than numpy for one cell at a time
+    grid = data.tobytes()
+    visited = bytearray(len(grid))
     region_count = 0
 
     # Iterate through each cell in the grid
-    for row in range(128):
-        for col in range(128):
-            # If we find an unvisited used square, it's a new region
-            if data[row][col] == '1' and (row, col) not in visited:
-                flood_fill(data, row, col, visited)
-                region_count += 1
+    for idx in range(len(grid)):
+        # If we find an unvisited used square, it's a new region
+        if grid[idx] and not visited[idx]:
+            flood_fill(grid, idx, visited)
+            region_count += 1
 
     return region_count
 
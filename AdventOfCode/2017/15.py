@@ -1,6 +1,16 @@
 #!/usr/bin/env python
 
+try:
+    from numba import njit
+except ImportError:  # Without numba the loops below run as plain Python
+    def njit(**kwargs):
+        return lambda func: func
 
+# The generators' modulus from the puzzle text, the Mersenne prime 2**31 - 1
+MODULUS = 2147483647
+
+
+@njit(cache=True)
 def generator(previous: int, factor: int, multiple: int = 1) -> int:
     """
     Generate the next value that's a multiple of the given number.
@@ -16,16 +26,27 @@ def generator(previous: int, factor: int, multiple: int = 1) -> int:
 
     value = previous
     while True:
-        value = (value * factor) % 2147483647  # modulus from puzzle text
+        # value * factor % MODULUS, without a division: since the modulus
+        # is 2**31 - 1, the high bits fold back onto the low ones
+        value *= factor
+        value = (value & MODULUS) + (value >> 31)
+        if value >= MODULUS:
+            value -= MODULUS
         if value % multiple == 0:
             return value
 
 
+@njit(cache=True)
 def count_matches(gen_a_start: int, gen_b_start: int, pairs: int,
                   multiple_a: int = 1, multiple_b: int = 1) -> int:
     """
     Count matching pairs with configurable criteria for both parts.
 
+    This runs tens of millions of rounds of integer arithmetic, so it and
+    generator are compiled with numba, turning each round into a handful
+    of native multiplies and compares. Every product stays below 2**47, so
+    the values fit in int64 throughout.
+
     Args:
         gen_a_start: Starting value for generator A
         gen_b_start: Starting value for generator B
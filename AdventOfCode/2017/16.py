@@ -6,31 +6,72 @@ def read_puzzle_input() -> list:
         return file.read().split(',')
 
 
-def dance(programs: list, moves: list) -> list:
+def compile_moves(moves: list) -> list:
+    """
+    Turn each move into a (kind, a, b) tuple of ints, so the dance doesn't
+    parse strings as it goes. Spins are (0, size, 0), exchanges are
+    (1, position, position) and partners are (2, program, program), with
+    programs numbered from 'a' = 0.
+    """
+
+    compiled = []
     for move in moves:
         if move[0] == 's':  # Spin
-            x = int(move[1:])
-            programs = programs[-x:] + programs[:-x]
+            compiled.append((0, int(move[1:]), 0))
         elif move[0] == 'x':  # Exchange
             a, b = map(int, move[1:].split('/'))
-            programs[a], programs[b] = programs[b], programs[a]
+            compiled.append((1, a, b))
         elif move[0] == 'p':  # Partner
-            a, b = programs.index(move[1]), programs.index(move[3])
-            programs[a], programs[b], = programs[b], programs[a]
-    return programs
-
+            compiled.append((2, ord(move[1]) - 97, ord(move[3]) - 97))
+    return compiled
 
-def find_cycle_length(initial: list, moves: list) -> tuple:
-    seen = {}
-    programs = initial.copy()
-    for i in range(1, 1_000_000):
-        programs = dance(programs, moves)
-        state = ''.join(programs)
-        if state in seen:
-            return i - seen[state], seen[state]
-        seen[state] = i
 
-    return None, None
+def dance(programs: list, moves: list) -> list:
+    """
+    Perform the compiled moves on the programs.
+
+    The line is held as two tables that are kept in step: perm[slot] is the
+    program in that slot, and pos[program] is the slot it's in. A spin
+    never moves anything, it just shifts the offset at which the line
+    starts within perm, and exchanges and partners each swap two entries
+    in both tables. Every move is O(1), rather than copying the line for
+    spins and scanning it for partners.
+    """
+
+    size = len(programs)
+    perm = [ord(p) - 97 for p in programs]
+    pos = [0] * size
+    for slot, program in enumerate(perm):
+        pos[program] = slot
+    start = 0  # Slot in perm holding the front of the line
+
+    for kind, a, b in moves:
+        if kind == 0:  # Spin
+            start = (start - a) % size
+            continue
+        if kind == 1:  # Exchange
+            i, j = (start + a) % size, (start + b) % size
+        else:  # Partner
+            i, j = pos[a], pos[b]
+        perm[i], perm[j] = perm[j], perm[i]
+        pos[perm[i]], pos[perm[j]] = i, j
+
+    return [chr(97 + perm[(start + i) % size]) for i in range(size)]
+
+
+def permutation_power(perm: list, k: int) -> list:
+    """
+    Raise a permutation (perm[i] is where i maps to) to the k-th power by
+    repeated squaring, in O(n log k) rather than O(n k).
+    """
+
+    result = list(range(len(perm)))
+    while k:
+        if k & 1:
+            result = [perm[i] for i in result]
+        perm = [perm[i] for i in perm]
+        k >>= 1
+    return result
 
 
 def part_one(data: list) -> str:
@@ -38,7 +79,7 @@ def part_one(data: list) -> str:
         'a', 'b', 'c', 'd', 'e', 'f', 'g', 'h',
         'i', 'j', 'k', 'l', 'm', 'n', 'o', 'p'
     ]
-    return ''.join(dance(programs, data))
+    return ''.join(dance(programs, compile_moves(data)))
 
 
 def part_two(data: list) -> str:
@@ -47,13 +88,25 @@ def part_two(data: list) -> str:
         'i', 'j', 'k', 'l', 'm', 'n', 'o', 'p'
     ]
 
-    cycle_length, offset = find_cycle_length(programs, data)
-    remaining_dances = (1_000_000_000 - offset) % cycle_length
-
-    for _ in range(offset + remaining_dances):
-        programs = dance(programs, data)
-
-    return ''.join(programs)
+    # Spins and exchanges only ever move slots around, whatever is in them,
+    # and partners only ever swap names, wherever they are. So one dance is
+    # a shuffle of the slots followed by a renaming of the programs, and
+    # since the two commute, a billion dances are a billion shuffles then a
+    # billion renamings, each a power of a single permutation.
+    moves = compile_moves(data)
+    shuffle = dance(programs, [move for move in moves if move[0] != 2])
+    rename = dance(programs, [move for move in moves if move[0] == 2])
+
+    # Which slot each slot's program comes from, and what each program ends
+    # up called, after one dance
+    source = [ord(p) - 97 for p in shuffle]
+    names = [ord(p) - 97 for p in rename]
+
+    source = permutation_power(source, 1_000_000_000)
+    names = permutation_power(names, 1_000_000_000)
+
+    return ''.join(chr(97 + names[ord(programs[slot]) - 97])
+                   for slot in source)
 
 
 if __name__ == "__main__":
@@ -1,5 +1,11 @@
 #!/usr/bin/env python
 
+try:
+    from numba import njit
+except ImportError:  # Without numba the loop below runs as plain Python
+    def njit(**kwargs):
+        return lambda func: func
+
 
 def part_one() -> int:
     steps = 356
@@ -14,6 +20,7 @@ def part_one() -> int:
     return buffer[(position + 1) % len(buffer)]
 
 
+@njit(cache=True)
 def part_two() -> int:
     steps = 356
     iterations = 50_000_000
@@ -22,6 +29,7 @@ def part_two() -> int:
 
     # Since we only care about what's after position 0, and 0 always stays at
     # index 0 in the buffer, we only need to track when we insert at position 1
+    # (that is still 50 million rounds of integer arithmetic, hence numba)
     for i in range(1, iterations + 1):
         position = ((position + steps) % i) + 1
 
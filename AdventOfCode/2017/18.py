@@ -8,6 +8,11 @@ programs. It processes instructions like playing sounds, setting register
 values, performing arithmetic operations, and recovering sounds.
 """
 
+from collections import deque
+
+# The instruction names, in opcode order
+OPCODES = ['snd', 'set', 'add', 'mul', 'mod', 'rcv', 'jgz']
+
 
 def read_puzzle_input() -> list:
     """
@@ -21,6 +26,49 @@ def read_puzzle_input() -> list:
         return file.read().splitlines()
 
 
+def compile_program(data: list) -> tuple:
+    """
+    Translate the instructions once, before any of them are run.
+
+    Each instruction becomes (opcode, x, y), where the opcode indexes
+    OPCODES and both operands are indexes into a register list. Registers
+    a-z take slots 0-25, and every literal gets a slot of its own after
+    them holding its value, so reading an operand is always a single list
+    index, with no string parsing or dict lookups while the program runs.
+
+    Args:
+        data (list): A list of instructions to compile.
+
+    Returns:
+        tuple: The compiled program, and the initial register list (the
+               named registers at 0, followed by the literals).
+    """
+
+    literals = {}  # Literal value -> register slot
+
+    def operand(v):
+        """
+        Get the register slot for a register name or literal.
+
+        Args:
+            v (str): A register name or literal value.
+
+        Returns:
+            int: The slot in the register list holding its value.
+        """
+        if v.isalpha():  # A register name
+            return ord(v) - ord('a')
+        return literals.setdefault(int(v), 26 + len(literals))
+
+    program = []
+    for line in data:
+        cmd, *args = line.split()
+        x = operand(args[0])
+        y = operand(args[1]) if len(args) > 1 else x
+        program.append((OPCODES.index(cmd), x, y))
+    return program, [0] * 26 + list(literals)
+
+
 def part_one(data: list) -> int:
     """
     Simulate a single program executing the given instructions.
@@ -44,57 +92,30 @@ def part_one(data: list) -> int:
         int: The frequency of the first recovered sound.
     """
 
-    registers = {}  # Dictionary to store register values
+    program, registers = compile_program(data)
     sound = -1  # Most recently played sound frequency
     i = 0  # Instruction pointer
 
-    while 0 <= i < len(data):  # Continue until we jump outside the program
-        parts = data[i].split()  # Split the instruction into parts
-        cmd = parts[0]  # The command (snd, set, add, etc.)
-        x = parts[1]  # The first parameter (usually a register)
-
-        # Helper function to get the value of a register or literal
-        def get_val(v):
-            """
-            Get the value of a register or literal.
-
-            Args:
-                v (str): A register name or literal value.
-
-            Returns:
-                int: The value of the register or the literal as an integer.
-            """
-            if v.isalpha():  # If it's a letter (register name)
-                return registers.get(v, 0)  # Get register value, default to 0
-            return int(v)  # Otherwise, it's a literal value
-
-        # Initialize register if it doesn't exist yet
-        if x.isalpha() and x not in registers:
-            registers[x] = 0
-
-        # Execute the instruction based on the command
-        if cmd == "snd":  # Play sound
-            sound = get_val(x)
-        elif cmd == "set":  # Set register
-            y = parts[2]  # The second parameter
-            registers[x] = get_val(y)
-        elif cmd == "add":  # Add to register
-            y = parts[2]
-            registers[x] += get_val(y)
-        elif cmd == "mul":  # Multiply register
-            y = parts[2]
-            registers[x] *= get_val(y)
-        elif cmd == "mod":  # Modulo operation
-            y = parts[2]
-            registers[x] %= get_val(y)
-        elif cmd == "rcv":  # Recover sound
-            if get_val(x) != 0:
+    while 0 <= i < len(program):  # Continue until we jump outside the program
+        cmd, x, y = program[i]
+
+        # Execute the instruction based on the opcode
+        if cmd == 0:  # snd: Play sound
+            sound = registers[x]
+        elif cmd == 1:  # set: Set register
+            registers[x] = registers[y]
+        elif cmd == 2:  # add: Add to register
+            registers[x] += registers[y]
+        elif cmd == 3:  # mul: Multiply register
+            registers[x] *= registers[y]
+        elif cmd == 4:  # mod: Modulo operation
+            registers[x] %= registers[y]
+        elif cmd == 5:  # rcv: Recover sound
+            if registers[x] != 0:
                 return sound  # Return the last played sound
-        elif cmd == "jgz":  # Jump if greater than zero
-            y = parts[2]
-            if get_val(x) > 0:
-                i += get_val(y)  # Jump forward or backward
-                continue  # Skip the normal increment
+        elif registers[x] > 0:  # jgz: Jump if greater than zero
+            i += registers[y]  # Jump forward or backward
+            continue  # Skip the normal increment
 
         i += 1  # Move to the next instruction
 
@@ -120,6 +141,8 @@ def part_two(data: list) -> int:
         int: The number of times program 1 sends a value.
     """
 
+    code, initial = compile_program(data)
+
     def create_program(pid):
         """
         Create a new program with the given ID.
@@ -131,34 +154,18 @@ def part_two(data: list) -> int:
             dict: A dictionary representing the program's state.
         """
 
+        registers = initial.copy()
+        registers[ord('p') - ord('a')] = pid  # Register 'p' holds the ID
         return {
-            "registers": {"p": pid},  # Initialize register 'p' with program ID
+            "registers": registers,  # Register values, then the literals
             "position": 0,  # Instruction pointer
-            "queue": [],  # Message queue
+            "queue": deque(),  # Message queue
             "send_count": 0,  # Counter for sent messages
             "waiting": False  # Flag for waiting on receive
         }
 
     programs = [create_program(0), create_program(1)]  # Create both programs
 
-    # Helper function to get value
-    def get_val(program, v):
-        """
-        Get the value of a register or literal for a specific program.
-
-        Args:
-            program (dict): The program's state.
-            v (str): A register name or literal value.
-
-        Returns:
-            int: The value of the register or the literal as an integer.
-        """
-
-        if v.isalpha():  # If it's a letter (register name)
-            # Return the register value, default to 0
-            return program["registers"].get(v, 0)
-        return int(v)  # Otherwise, it's a literal value
-
     # Run until deadlock (both programs waiting or terminated)
     while True:
         deadlock = True  # Assume deadlock until proven otherwise
@@ -168,7 +175,7 @@ def part_two(data: list) -> int:
             other = programs[1 - pid]  # The other program
 
             # Skip if program is terminated (outside instruction range)
-            if not (0 <= program["position"] < len(data)):
+            if not (0 <= program["position"] < len(code)):
                 continue
 
             # Skip if program is waiting and has no messages
@@ -178,52 +185,43 @@ def part_two(data: list) -> int:
             # We can execute at least one instruction
             deadlock = False
 
-            # Execute instruction
-            parts = data[program["position"]].split()
-            cmd = parts[0]  # The command
-            x = parts[1]  # The first parameter
-
-            # Initialize register if needed
-            if x.isalpha() and x not in program["registers"]:
-                program["registers"][x] = 0
-
-            # Execute the instruction based on the command
-            if cmd == "snd":  # Send value to other program
-                val = get_val(program, x)
-                other["queue"].append(val)  # Add to other program's queue
-                program["send_count"] += 1  # Increment send counter
-                program["position"] += 1
-            elif cmd == "set":  # Set register
-                y = parts[2]
-                program["registers"][x] = get_val(program, y)
-                program["position"] += 1
-            elif cmd == "add":  # Add to register
-                y = parts[2]
-                program["registers"][x] += get_val(program, y)
-                program["position"] += 1
-            elif cmd == "mul":  # Multiply register
-                y = parts[2]
-                program["registers"][x] *= get_val(program, y)
-                program["position"] += 1
-            elif cmd == "mod":  # Modulo operation
-                y = parts[2]
-                program["registers"][x] %= get_val(program, y)
-                program["position"] += 1
-            elif cmd == "rcv":  # Receive value from queue
-                if program["queue"]:  # If there's a message in the queue
-                    # Get first message
-                    program["registers"][x] = program["queue"].pop(0)
-
-                    program["waiting"] = False
-                    program["position"] += 1
-                else:
-                    program["waiting"] = True  # Wait for a message
-            elif cmd == "jgz":  # Jump if greater than zero
-                y = parts[2]
-                if get_val(program, x) > 0:
-                    program["position"] += get_val(program, y)
-                else:
-                    program["position"] += 1
+            # Run this program until it has to wait for a message (or
+            # terminates), rather than switching after every instruction.
+            # Each program only sees the other's messages in the order they
+            # were sent, so the interleaving doesn't change the outcome
+            registers = program["registers"]
+            queue = program["queue"]
+            outbox = other["queue"]
+            position = program["position"]
+            sent = 0
+
+            while 0 <= position < len(code):
+                cmd, x, y = code[position]
+
+                # Execute the instruction based on the opcode
+                if cmd == 0:  # snd: Send value to other program
+                    outbox.append(registers[x])  # Add to other's queue
+                    sent += 1
+                elif cmd == 1:  # set: Set register
+                    registers[x] = registers[y]
+                elif cmd == 2:  # add: Add to register
+                    registers[x] += registers[y]
+                elif cmd == 3:  # mul: Multiply register
+                    registers[x] *= registers[y]
+                elif cmd == 4:  # mod: Modulo operation
+                    registers[x] %= registers[y]
+                elif cmd == 5:  # rcv: Receive value from queue
+                    if not queue:
+                        break  # Wait for a message
+                    registers[x] = queue.popleft()  # Get first message
+                elif registers[x] > 0:  # jgz: Jump if greater than zero
+                    position += registers[y]
+                    continue
+                position += 1
+
+            program["position"] = position
+            program["send_count"] += sent  # Add to the send counter
+            program["waiting"] = True  # Blocked, unless it has terminated
 
         # If both programs are in deadlock, we're done
         if deadlock:
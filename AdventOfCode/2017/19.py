@@ -62,14 +62,21 @@ def follow_path(grid):
             - The total number of steps taken (Part 2 answer)
     """
 
+    # Lay the grid out as one string, with every row padded to the same
+    # width and a border of spaces all round, so that a position is a single
+    # index, each direction is a fixed offset, and stepping off the edge of
+    # the diagram just lands on a space without any bounds checks
+    width = max(map(len, grid)) + 2
+    border = ' ' * width
+    tubes = border + ''.join(f" {row}".ljust(width) for row in grid) + border
+
     # Find the starting position (the '|' character in the first row)
-    start_col = grid[0].index('|')
-    pos = (0, start_col)
+    pos = width + 1 + grid[0].index('|')
 
     # Initialize direction to move downward
-    # Directions are represented as (row_delta, col_delta)
-    # (1, 0) = down, (-1, 0) = up, (0, 1) = right, (0, -1) = left
-    direction = (1, 0)  # Start by moving down
+    # Directions are represented as offsets into tubes
+    # width = down, -width = up, 1 = right, -1 = left
+    direction = width  # Start by moving down
 
     # Track the collected letters and steps
     letters = []  # Will store all letters encountered
@@ -77,46 +84,28 @@ def follow_path(grid):
 
     while True:
         # Move to the next position
-        pos = (pos[0] + direction[0], pos[1] + direction[1])
+        pos += direction
         steps += 1
-
-        # Get the current character (or handle out of bounds)
-        row, col = pos
-        # Check if position is within grid boundaries
-        if 0 <= row < len(grid) and 0 <= col < len(grid[row]):
-            char = grid[row][col]
-        else:
-            # We've gone out of bounds, so we're done
-            break
+        char = tubes[pos]
 
         # If we hit a space, we've reached the end of the path
         if char == ' ':
             break
 
-        # If we hit a letter, collect it for Part 1
-        if char.isalpha():
-            letters.append(char)
-
         # If we hit a '+', we need to change direction
         if char == '+':
             # Try all four possible directions
-            for new_dir in [(0, 1), (1, 0), (0, -1), (-1, 0)]:
-                # Skip the opposite direction (the one we came from)
-                # This prevents backtracking
-                if (new_dir[0] == -direction[0] and
-                        new_dir[1] == -direction[1]):
-                    continue
-
-                # Check if there's a valid path in this direction
-                # A valid path is within grid bounds and not a space
-                new_row, new_col = row + new_dir[0], col + new_dir[1]
-                if (0 <= new_row < len(grid) and
-                    0 <= new_col < len(grid[new_row]) and
-                        grid[new_row][new_col] != ' '):
-                    # Found a valid direction, update and continue
+            for new_dir in (1, width, -1, -width):
+                # Skip the opposite direction (the one we came from), and
+                # take the one that leads on to more path
+                if new_dir != -direction and tubes[pos + new_dir] != ' ':
                     direction = new_dir
                     break
 
+        # If we hit a letter, collect it for Part 1
+        elif char.isalpha():
+            letters.append(char)
+
     # Return both parts' answers: the collected letters and total steps
     return ''.join(letters), steps
 
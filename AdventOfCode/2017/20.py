@@ -9,99 +9,114 @@ acceleration, velocity, and position constraints. The goal is to:
     - Detect and remove colliding particles.
 """
 
-import copy
 import re
 
+import numpy as np
+from numpy.typing import NDArray
 
-class Particle:
-    """
-    Represents a particle with position, velocity, and acceleration in a 3D
-    space. Each particle follows basic kinematics where acceleration affects
-    velocity, and velocity affects position.
-    """
+# Matches each (possibly negative) number in the input
+NUMBER = re.compile(r'-?\d+')
 
-    def __init__(self, index, position, velocity, acceleration):
-        self.index = index                  # Unique ID for the particle
-        self.position = position            # Current position (x, y, z)
-        self.velocity = velocity            # Current velocity (x, y, z)
-        self.acceleration = acceleration    # Current acceleration (x, y, z)
+# Multipliers folding a position into a single int64 hash (wrapping on
+# overflow), so particles can be compared one number at a time
+HASH_WEIGHTS = np.array([2654435761, 2246822519, 3266489917], dtype=np.int64)
 
-    def update(self):
-        """
-        Updates the particle's velocity and position based on acceleration.
-        """
 
-        self.velocity = tuple(v + a for v, a in zip(self.velocity,
-                                                    self.acceleration))
-        self.position = tuple(p + v for p, v in zip(self.position,
-                                                    self.velocity))
+def read_puzzle_input() -> tuple:
+    """
+    Reads and parses the input file into three (N, 3) arrays, holding the
+    positions, velocities and accelerations of all the particles, with one
+    row per particle in input order (so a row number is a particle's ID).
+    Input format: p=<x,y,z>, v=<x,y,z>, a=<x,y,z>
 
-    def manhattan_distance(self):
-        """Computes the Manhattan distance from the origin (0,0,0)."""
+    Every line holds nine numbers in the same order, so the whole file is
+    read with a single regex pass.
+    """
 
-        return sum(abs(x) for x in self.position)
+    with open("20.in", "r") as file:
+        values = list(map(int, NUMBER.findall(file.read())))
+    state = np.array(values, dtype=np.int64).reshape(-1, 3, 3)
+    return state[:, 0], state[:, 1], state[:, 2]
 
 
-def read_puzzle_input() -> list:
+def update(positions: NDArray[np.int64], velocities: NDArray[np.int64],
+           accelerations: NDArray[np.int64]):
     """
-    Reads and parses the input file, creating a list of Particle objects.
-    Input format: p=<x,y,z>, v=<x,y,z>, a=<x,y,z>
+    Moves every particle on by one tick, in place: acceleration affects
+    velocity, and then velocity affects position.
     """
 
-    particles = []
-    pattern = re.compile(r'<(-?\d+),(-?\d+),(-?\d+)>')
-    with open("20.in", "r") as file:
-        for i, line in enumerate(file.read().splitlines()):
-            values = list(map(int,
-                              pattern.findall(line)[0] +
-                              pattern.findall(line)[1] +
-                              pattern.findall(line)[2]))
-            p, v, a = values[:3], values[3:6], values[6:]
-            particles.append(Particle(i, tuple(p), tuple(v), tuple(a)))
-    return particles
+    velocities += accelerations
+    positions += velocities
 
 
-def part_one(data: list) -> int:
+def part_one(data: tuple) -> int:
     """
     Determines which particle will stay closest to the origin in the long run.
-    We assume that acceleration dominates over time, so we find the particle
-    with the smallest acceleration magnitude first, and in case of ties,
-    we compare velocity and initial position.
+
+    Rather than simulating, this looks at where the distances are heading.
+    Each coordinate of a particle's position after t ticks is
+    p + v t + a t (t + 1) / 2, and eventually has the same sign as its
+    leading term (from a, or v if a is 0, or p if both are). From then on,
+    twice the Manhattan distance is the quadratic sum of
+    sign * (a t^2 + (2 v + a) t + 2 p) over the coordinates, so the particle
+    that stays closest is the one with the smallest quadratic, comparing
+    the coefficients in turn.
     """
 
-    particles = copy.deepcopy(data)  # Prevent modifying original data
+    positions, velocities, accelerations = data
+
+    # The sign each coordinate settles on
+    signs = np.sign(accelerations)
+    signs = np.where(signs == 0, np.sign(velocities), signs)
+    signs = np.where(signs == 0, np.sign(positions), signs)
+
+    # The quadratic's coefficients for every particle
+    squared = (signs * accelerations).sum(axis=1)
+    linear = (signs * (2 * velocities + accelerations)).sum(axis=1)
+    constant = (signs * positions).sum(axis=1)
 
-    # Simulate for a long time to allow acceleration to dominate
-    for _ in range(1000):
-        for p in particles:
-            p.update()
-    return min(particles, key=lambda p: p.manhattan_distance()).index
+    # Sort by the t^2 coefficient, then t, then the constant (lexsort takes
+    # its keys last first, and keeps ties in ID order)
+    return int(np.lexsort((constant, linear, squared))[0])
 
 
-def part_two(data: list) -> int:
+def part_two(data: tuple) -> int:
     """
     Simulates particle movement while removing particles that collide.
     Runs until no more collisions occur or a sufficient number of iterations
     has passed.
     """
 
-    particles = copy.deepcopy(data)  # Prevent modifying original data
+    # Copy the positions and velocities, which are updated in place
+    positions, velocities, accelerations = data
+    positions, velocities = positions.copy(), velocities.copy()
 
     for _ in range(1000):  # Simulate long enough to resolve most collisions
-        positions = {}
-        to_remove = set()
-
-        # Move particles and track positions
-        for p in particles:
-            p.update()
-            if p.position in positions:
-                to_remove.add(p.position)  # Mark this position for removal
-            positions.setdefault(p.position, []).append(p)
-
-        # Remove all particles that occupy a position marked for collision
-        particles = [p for p in particles if p.position not in to_remove]
-
-    return len(particles)
+        update(positions, velocities, accelerations)
+
+        # Count how many particles share each position's hash, which is
+        # much quicker than comparing the positions themselves by row
+        hashes = positions @ HASH_WEIGHTS
+        _, shared, counts = np.unique(hashes, return_inverse=True,
+                                      return_counts=True)
+        alone = counts[shared] == 1
+        if not alone.all():
+            # Particles in the same position always share a hash, but a
+            # shared hash could still be a coincidence, so confirm which of
+            # those particles really aren't alone in their position
+            suspects = np.flatnonzero(~alone)
+            _, shared, counts = np.unique(positions[suspects], axis=0,
+                                          return_inverse=True,
+                                          return_counts=True)
+            alone[suspects] = counts[shared.reshape(-1)] == 1
+
+            # Keep only the particles that are alone in their positions
+            positions = positions[alone]
+            velocities = velocities[alone]
+            accelerations = accelerations[alone]
+
+    return len(positions)
 
 
 if __name__ == "__main__":
@@ -1,6 +1,9 @@
 #!/usr/bin/env python
 
-from typing import Dict, Tuple, List
+from typing import Dict, List, Tuple
+
+import numpy as np
+from numpy.typing import NDArray
 
 
 def read_puzzle_input() -> List[str]:
@@ -8,96 +11,92 @@ def read_puzzle_input() -> List[str]:
         return file.read().splitlines()
 
 
-def parse_input(data: List) -> Dict[Tuple[str, ...], Tuple[str, ...]]:
-    """Parse the input text into a dictionary of rules"""
-    rules = {}
-    for line in data:
-        pattern, result = line.split(' => ')
-        pattern = tuple(pattern.split('/'))
-        result = tuple(result.split('/'))
-        rules[pattern] = result
+def weights(size: int) -> NDArray[np.int64]:
+    """The value of each pixel's bit in the mask of a size x size square"""
+    return 1 << np.arange(size * size, dtype=np.int64).reshape(size, size)
 
-        # Add all possible rotations and flips
-        for i in range(3):
-            pattern = rotate(pattern)
-            rules[pattern] = result
-            flipped = flip(pattern)
-            rules[flipped] = result
 
-    return rules
+def to_pixels(rows: str) -> NDArray[np.uint8]:
+    """Turn a pattern such as '.#./..#/###' into an array of 0s and 1s"""
+    return np.array([[c == '#' for c in row] for row in rows.split('/')],
+                    dtype=np.uint8)
 
 
-def flip(pattern: Tuple[str, ...]) -> Tuple[str, ...]:
-    """Flip a pattern horizontally"""
-    return tuple(row[::-1] for row in pattern)
+def parse_input(data: List) -> Dict[int, NDArray[np.uint8]]:
+    """
+    Parse the input text into a lookup table of rules for each square size.
 
+    A square's pixels are packed into an integer bitmask, so the table for
+    size 2 has 16 entries and the one for size 3 has 512. Entry i holds the
+    enhanced square for the pattern whose mask is i.
+    """
+    rules = {
+        2: np.zeros((1 << 4, 3, 3), dtype=np.uint8),
+        3: np.zeros((1 << 9, 4, 4), dtype=np.uint8),
+    }
+    for line in data:
+        pattern, result = map(to_pixels, line.split(' => '))
+        size = len(pattern)
 
-def rotate(pattern: Tuple[str, ...]) -> Tuple[str, ...]:
-    """Rotate a pattern 90 degrees clockwise"""
-    size = len(pattern)
-    return tuple(
-        ''.join(
-            pattern[size-1-j][i] for j in range(size)
-        ) for i in range(size)
-    )
+        # Add all possible rotations and flips
+        for _ in range(4):
+            pattern = np.rot90(pattern, -1)
+            for variant in (pattern, np.fliplr(pattern)):
+                rules[size][int((variant * weights(size)).sum())] = result
+
+    return rules
 
 
-def split_grid(grid: Tuple[str, ...]) -> List[List[Tuple[str, ...]]]:
-    """Split the grid into 2x2 or 3x3 blocks"""
+def split_grid(grid: NDArray[np.uint8]) -> Tuple[NDArray[np.uint16], int]:
+    """
+    Split the grid into 2x2 or 3x3 blocks, returning each block's bitmask,
+    arranged as the blocks are in the grid, and the block size.
+    """
     size = len(grid)
     if size % 2 == 0:  # Split in to 2x2 blocks
         block_size = 2
     else:  # Split in to 3x3 blocks
         block_size = 3
 
-    blocks = []
-    for y in range(0, size, block_size):
-        row_blocks = []
-        for x in range(0, size, block_size):
-            block = tuple(grid[y+i][x:x+block_size] for i in range(block_size))
-            row_blocks.append(block)
-        blocks.append(row_blocks)
-
-    return blocks
+    # View the grid as rows of blocks of rows of pixels, without copying.
+    # blocks[:, i, :, j] is then a strided view of pixel (i, j) of every
+    # block, so the masks are built up a pixel position at a time, with
+    # one small shift and add over all the blocks for each
+    count = size // block_size
+    blocks = grid.reshape(count, block_size, count, block_size)
+    masks = np.zeros((count, count), dtype=np.uint16)
+    for bit in range(block_size * block_size):
+        i, j = divmod(bit, block_size)
+        masks += blocks[:, i, :, j].astype(np.uint16) << bit
+    return masks, block_size
 
 
-def enhance_blocks(blocks: List[List[Tuple[str, ...]]],
-                   rules: Dict[Tuple[str, ...], Tuple[str, ...]]
-                   ) -> List[List[Tuple[str, ...]]]:
-    """Enhance each block according to the rules"""
-    enhanced = []
-    for row in blocks:
-        enhanced_row = []
-        for block in row:
-            enhanced_row.append(rules[block])
-        enhanced.append(enhanced_row)
+def enhance_blocks(masks: NDArray[np.uint16], block_size: int,
+                   rules: Dict[int, NDArray[np.uint8]]
+                   ) -> NDArray[np.uint8]:
+    """Enhance each block according to the rules, by lookup on its mask"""
+    return rules[block_size][masks]
 
-    return enhanced
 
-
-def merge_blocks(blocks: List[List[Tuple[str, ...]]]) -> Tuple[str, ...]:
+def merge_blocks(blocks: NDArray[np.uint8]) -> NDArray[np.uint8]:
     """Merge blocks back into a single grid"""
-    result = []
-    for row_blocks in blocks:
-        block_height = len(row_blocks[0])
-        for i in range(block_height):
-            result.append(''.join(block[i] for block in row_blocks))
-
-    return tuple(result)
+    count, _, block_size, _ = blocks.shape
+    size = count * block_size
+    return blocks.transpose(0, 2, 1, 3).reshape(size, size)
 
 
-def count_on_pixels(grid: Tuple[str, ...]) -> int:
-    """Count the number of '#' characters in the grid."""
-    return sum(row.count('#') for row in grid)
+def count_on_pixels(grid: NDArray[np.uint8]) -> int:
+    """Count the number of pixels that are on in the grid."""
+    return int(np.count_nonzero(grid))
 
 
 def part_one(data: List, iterations: int = 5) -> int:
     rules = parse_input(data)
-    grid: Tuple[str, ...] = ('.#.', '..#', '###')  # Initial pattern
+    grid = to_pixels('.#./..#/###')  # Initial pattern
 
     for _ in range(iterations):
-        blocks = split_grid(grid)
-        enhanced_blocks = enhance_blocks(blocks, rules)
+        masks, block_size = split_grid(grid)
+        enhanced_blocks = enhance_blocks(masks, block_size, rules)
         grid = merge_blocks(enhanced_blocks)
 
     return count_on_pixels(grid)
@@ -1,6 +1,27 @@
 #!/usr/bin/env python
 
-from collections import defaultdict
+import numpy as np
+from numpy.typing import NDArray
+
+try:
+    from numba import njit
+    HAVE_NUMBA = True
+except ImportError:  # Without numba the loop below runs as plain Python
+    HAVE_NUMBA = False
+
+    def njit(**kwargs):
+        return lambda func: func
+
+# Node states, in the order a node cycles through them in part two (part one
+# skips weakened and flagged, going straight between clean and infected)
+CLEAN, WEAKENED, INFECTED, FLAGGED = range(4)
+
+# Marks the nodes just beyond the edge of the map
+EDGE = 4
+
+# How much clean space to add around the map, on each side, whenever the
+# virus carrier walks off its edge
+MARGIN = 128
 
 
 def read_puzzle_input() -> list:
@@ -8,119 +29,146 @@ def read_puzzle_input() -> list:
         return file.read().splitlines()
 
 
-def part_one(data: list) -> int:
+def make_map(nodes: NDArray[np.uint8]) -> tuple:
     """
-    Simulates the virus spreading across the grid for a given number of bursts.
+    Lays the map out flat, row by row, ringed by EDGE nodes: a uint8 array
+    for numba, or a bytearray when spread runs as plain Python.
 
     Args:
-        grid (list of str): The initial grid representing infected (#) and
-                            clean (.) nodes.
-        bursts (int): The number of steps to simulate.
+        nodes (NDArray[np.uint8]): The state of each node on the map.
 
     Returns:
-        int: The total number of infections caused by the virus.
+        tuple: The flat map, and its width (including the ring).
+    """
+
+    nodes = np.pad(nodes, 1, constant_values=EDGE)
+    if HAVE_NUMBA:
+        return nodes.reshape(-1), nodes.shape[1]
+    return bytearray(nodes.tobytes()), nodes.shape[1]
+
+
+@njit(cache=True)
+def spread(nodes, position: int, width: int, dir_index: int, bursts: int,
+           step: int) -> tuple:
     """
+    Runs bursts of activity on the map until they're all done, or the virus
+    carrier walks off the edge of the map.
 
-    grid = data.copy()
-    bursts = 10000
+    Positions are flat indexes, so each move is adding a fixed offset,
+    and the EDGE ring stands in for bounds checks.
+
+    Args:
+        nodes: The flat map from make_map; modified in place.
+        position (int): The carrier's index in the map.
+        width (int): The width of the map.
+        dir_index (int): The direction the carrier is facing.
+        bursts (int): The number of bursts to run.
+        step (int): How many states each burst moves a node on by: 2 in part
+                    one (clean <-> infected), 1 in part two.
+
+    Returns:
+        tuple: The number of bursts run, the carrier's position and
+               direction after them, and the number of infections caused.
+    """
 
     # Directions: up, right, down, left
-    directions = [(-1, 0), (0, 1), (1, 0), (0, -1)]
-    dir_index = 0  # Start facing up
-    # Start at the center of the grid
-    x, y = len(grid) // 2, len(grid[0]) // 2
+    moves = (-width, 1, width, -1)
     infections = 0  # Counter for infections caused
 
-    # Convert the grid to a dictionary for easier manipulation
-    # Keys are (x, y) coordinates, values are the state ('#' or '.')
-    grid_dict = defaultdict(lambda: '.')
-    for i in range(len(grid)):
-        for j in range(len(grid[i])):
-            grid_dict[(i, j)] = grid[i][j]
-
-    for _ in range(bursts):
-        # Check the current node's state
-        current_node = (x, y)
-        if grid_dict[current_node] == '#':
-            # Infected: Turn right
-            dir_index = (dir_index + 1) % 4
-            # Clean the node
-            grid_dict[current_node] = '.'
-        else:
-            # Clean: Turn left
-            dir_index = (dir_index - 1) % 4
-            # Infect the node
-            grid_dict[current_node] = '#'
+    for burst in range(bursts):
+        state = nodes[position]
+        if state == EDGE:
+            return burst, position, dir_index, infections
+
+        # Turn by the current node's state: clean turns left, weakened
+        # doesn't turn, infected turns right and flagged reverses
+        dir_index = (dir_index + state - 1) & 3
+
+        # Move the node on to its next state
+        new_state = (state + step) & 3
+        nodes[position] = new_state
+        if new_state == INFECTED:
             infections += 1
 
         # Move forward in the new direction
-        dx, dy = directions[dir_index]
-        x += dx
-        y += dy
+        position += moves[dir_index]
 
-    return infections
+    return bursts, position, dir_index, infections
 
 
-def part_two(data: list) -> int:
+def simulate(grid: list, bursts: int, step: int) -> int:
     """
     Simulates the virus spreading across the grid for a given number of bursts.
 
+    The map starts as the grid with a margin of clean nodes around it, and
+    is padded out further whenever the carrier reaches its edge.
+
     Args:
-        grid (list of str): The initial grid representing node states.
+        grid (list of str): The initial grid representing infected (#) and
+                            clean (.) nodes.
         bursts (int): The number of steps to simulate.
+        step (int): How many states each burst moves a node on by.
 
     Returns:
         int: The total number of infections caused by the virus.
     """
 
-    grid = data.copy()
-    bursts = 10000000
+    nodes = np.array([[c == '#' for c in row] for row in grid],
+                     dtype=np.uint8) * INFECTED
+    nodes = np.pad(nodes, MARGIN)
 
-    # Directions: up, right, down, left
-    directions = [(-1, 0), (0, 1), (1, 0), (0, -1)]
     dir_index = 0  # Start facing up
-    x, y = len(grid) // 2, len(grid[0]) // 2  # Start at the center of the grid
+    # Start at the center of the grid (allowing for the margin and the ring)
+    x, y = 1 + MARGIN + len(grid) // 2, 1 + MARGIN + len(grid[0]) // 2
     infections = 0  # Counter for infections caused
 
-    # Convert the grid to a dictionary for easier manipulation
-    # Keys are (x, y) coordinates, values are the state ('.', 'W', '#', or 'F')
-    grid_dict = defaultdict(lambda: '.')
-    for i in range(len(grid)):
-        for j in range(len(grid[i])):
-            grid_dict[(i, j)] = grid[i][j]
-
-    for _ in range(bursts):
-        # Check the current node's state
-        current_node = (x, y)
-        state = grid_dict[current_node]
-
-        if state == '.':
-            # Clean: Turn left
-            dir_index = (dir_index - 1) % 4
-            # Change to weakened
-            grid_dict[current_node] = 'W'
-        elif state == 'W':
-            # Weakened: Do not turn
-            # Change to infected
-            grid_dict[current_node] = '#'
-            infections += 1
-        elif state == '#':
-            # Infected: Turn right
-            dir_index = (dir_index + 1) % 4
-            # Change to flagged
-            grid_dict[current_node] = 'F'
-        elif state == 'F':
-            # Flagged: Reverse direction
-            dir_index = (dir_index + 2) % 4
-            # Change to clean
-            grid_dict[current_node] = '.'
+    while True:
+        flat, width = make_map(nodes)
+        done, position, dir_index, caused = spread(flat, x * width + y, width,
+                                                   dir_index, bursts, step)
+        bursts -= done
+        infections += caused
+        if not bursts:
+            return infections
 
-        # Move forward in the new direction
-        dx, dy = directions[dir_index]
-        x += dx
-        y += dy
+        # The carrier walked off the map, so extend it and carry on
+        nodes = np.frombuffer(flat, dtype=np.uint8).reshape(-1, width)
+        nodes = np.pad(nodes[1:-1, 1:-1], MARGIN)
+        x, y = divmod(position, width)
+        x, y = x + MARGIN, y + MARGIN
+
+
+def part_one(data: list) -> int:
+    """
+    Simulates the virus spreading across the grid for a given number of bursts.
+
+    Args:
+        grid (list of str): The initial grid representing infected (#) and
+                            clean (.) nodes.
+        bursts (int): The number of steps to simulate.
+
+    Returns:
+        int: The total number of infections caused by the virus.
+    """
+
+    # Nodes only go between clean and infected
+    return simulate(data, 10000, 2)
+
+
+def part_two(data: list) -> int:
+    """
+    Simulates the virus spreading across the grid for a given number of bursts.
+
+    Args:
+        grid (list of str): The initial grid representing node states.
+        bursts (int): The number of steps to simulate.
+
+    Returns:
+        int: The total number of infections caused by the virus.
+    """
 
-    return infections
+    # Nodes go from clean to weakened, infected, flagged and back to clean
+    return simulate(data, 10000000, 1)
 
 
 if __name__ == "__main__":
@@ -9,6 +9,9 @@ This program solves both parts of the puzzle:
 - Part 2: Determine the value in register 'h' when the program is done
 """
 
+# The instruction names, in opcode order
+OPCODES = ['set', 'sub', 'mul', 'jnz']
+
 
 def read_puzzle_input() -> list:
     """
@@ -22,6 +25,34 @@ def read_puzzle_input() -> list:
         return file.read().splitlines()
 
 
+def compile_program(instructions: list) -> tuple:
+    """
+    Turn each instruction into (opcode, x, y) ahead of time.
+
+    Operands become slots in a register list: a-h are slots 0-7 and each
+    literal is stored in a slot after them, so part_one never parses text.
+
+    Args:
+        instructions (list): Assembly instructions to compile.
+
+    Returns:
+        tuple: The compiled program, and its starting register list.
+    """
+
+    literals = {}  # Literal value -> register slot
+
+    def operand(v):
+        if v.isalpha():  # A register name
+            return ord(v) - ord('a')
+        return literals.setdefault(int(v), 8 + len(literals))
+
+    program = []
+    for line in instructions:
+        cmd, x, y = line.split()
+        program.append((OPCODES.index(cmd), operand(x), operand(y)))
+    return program, [0] * 8 + list(literals)
+
+
 def part_one(instructions: list) -> int:
     """
     Solve Part 1 by simulating the assembly code and counting 'mul'
@@ -33,6 +64,9 @@ def part_one(instructions: list) -> int:
     - mul X Y: Multiplies register X by value Y (and counts this operation)
     - jnz X Y: Jumps Y instructions if X is not zero
 
+    The instructions are compiled first, so each step is a tuple unpack
+    and a few list indexes.
+
     Args:
         instructions (list): Assembly instructions to execute.
 
@@ -40,42 +74,25 @@ def part_one(instructions: list) -> int:
         int: Number of times the 'mul' instruction is executed.
     """
 
-    # Initialize all registers (a to h) with value 0
-    registers = {c: 0 for c in 'abcdefgh'}
-
-    def get_val(v):
-        """
-        Get the value of a register or literal.
-
-        Args:
-            v (str): A register name or literal value.
-
-        Returns:
-            int: The value of the register or the literal as an integer.
-        """
-        if v in registers:
-            return registers[v]
-        return int(v)
-
+    program, registers = compile_program(instructions)
     mul_count = 0
     i = 0  # Instruction pointer
 
     # Execute instructions until we jump outside the program
-    while 0 <= i < len(instructions):
-        parts = instructions[i].split()
-        cmd, x, y = parts
-
-        # Execute the instruction based on the command
-        if cmd == 'set':  # Set register X to value Y
-            registers[x] = get_val(y)
-        elif cmd == 'sub':  # Decrease register X by value Y
-            registers[x] -= get_val(y)
-        elif cmd == 'mul':  # Multiply register X by value Y
-            registers[x] *= get_val(y)
+    while 0 <= i < len(program):
+        cmd, x, y = program[i]
+
+        # Execute the instruction based on the opcode
+        if cmd == 0:  # set: Set register X to value Y
+            registers[x] = registers[y]
+        elif cmd == 1:  # sub: Decrease register X by value Y
+            registers[x] -= registers[y]
+        elif cmd == 2:  # mul: Multiply register X by value Y
+            registers[x] *= registers[y]
             mul_count += 1
-        elif cmd == 'jnz':  # Jump if X is not 0 by Y instructions
-            if get_val(x) != 0:
-                i += get_val(y) - 1  # -1 because we increment i later
+        elif registers[x] != 0:  # jnz: Jump if X is not 0 by Y instructions
+            i += registers[y]
+            continue  # Skip the normal increment
 
         i += 1  # Move to the next instruction
 
@@ -184,6 +201,10 @@ def count_non_primes(b: int, c: int) -> int:
     """
     Count non-prime numbers in the range from b to c with step 17.
 
+    Rather than testing each number for primality separately, this sieves
+    every number up to c once, with a slice assignment striking out the
+    multiples of each prime, and then just reads off the range.
+
     Args:
         b (int): Start of the range.
         c (int): End of the range (inclusive).
@@ -192,46 +213,17 @@ def count_non_primes(b: int, c: int) -> int:
         int: Count of non-prime numbers in the range.
     """
 
-    count = 0
+    # composite[n] is 1 if n is not prime (0 and 1 included)
+    composite = bytearray(c + 1)
+    composite[:2] = b'\x01\x01'[:c + 1]
 
-    for n in range(b, c + 1, 17):
-        if not is_prime(n):
-            count += 1
-
-    return count
-
-
-def is_prime(n: int) -> bool:
-    """
-    Check if a number is prime using an optimized algorithm.
-
-    A prime number is only divisible by 1 and itself.
-    This implementation uses the 6k±1 optimization and stops checking
-    at the square root of n.
-
-    Args:
-        n (int): The number to check.
-
-    Returns:
-        bool: True if n is prime, False otherwise.
-    """
+    # Strike out the multiples of each prime up to sqrt(c), starting from
+    # its square (smaller multiples have a smaller prime factor)
+    for p in range(2, int(c ** 0.5) + 1):
+        if not composite[p]:
+            composite[p * p::p] = b'\x01' * len(range(p * p, c + 1, p))
 
-    # Handle edge cases
-    if n <= 1:
-        return False
-    if n <= 3:
-        return True
-    if n % 2 == 0 or n % 3 == 0:
-        return False
-
-    # Check divisibility by numbers of form 6k±1 up to sqrt(n)
-    i = 5
-    while i * i <= n:
-        if n % i == 0 or n % (i + 2) == 0:
-            return False
-        i += 6
-
-    return True
+    return sum(composite[b:c + 1:17])
 
 
 if __name__ == "__main__":
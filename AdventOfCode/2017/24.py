@@ -1,6 +1,8 @@
 #!/usr/bin/env python
 
-from typing import List, Tuple
+from collections import defaultdict
+from functools import lru_cache
+from typing import Dict, List, Tuple
 
 
 def read_puzzle_input(filename: str = "24.in") -> List[Tuple[int, int]]:
@@ -19,63 +21,95 @@ def read_puzzle_input(filename: str = "24.in") -> List[Tuple[int, int]]:
         ]
 
 
+def group_by_port(components: List[Tuple[int, int]]
+                  ) -> Dict[int, List[Tuple[int, int, int]]]:
+    """
+    Groups the components by the ports they have, so that only those that
+    fit an open port need to be looked at.
+
+    :param components: List of available components.
+    :return: For each port value, a list of (index, other port, strength)
+             for the components with that port.
+    """
+
+    ports = defaultdict(list)
+    for i, (a, b) in enumerate(components):
+        ports[a].append((i, b, a + b))
+        if a != b:
+            ports[b].append((i, a, a + b))
+    return ports
+
+
 def calc_strongest_bridge(components: List[Tuple[int, int]],
                           open_port: int = 0,
-                          used: frozenset = frozenset()) -> int:
+                          used: int = 0) -> int:
     """
     Recursively finds the strongest possible bridge.
 
+    The used components are a bitmask, so marking one is a single OR, and
+    the search is memoized on (open_port, used): a set of components laid
+    down in a different order, ending on the same port, leaves exactly the
+    same choices, and is only explored once. Each step only looks at the
+    components with a matching port, from group_by_port.
+
     :param components: List of available components.
     :param open_port: The port value to which the next piece must connect.
-    :param used: A frozenset of used component indices to prevent reuse.
+    :param used: A bitmask of used component indices to prevent reuse.
     :return: Strength of the strongest possible bridge.
     """
 
-    max_strength = 0
+    ports = group_by_port(components)
 
-    for i, (a, b) in enumerate(components):
-        if i in used:
-            continue  # Skip components that are already used
-
-        if a == open_port or b == open_port:
-            next_port = b if a == open_port else a  # Determine new open port
-            bridge_strength = (a + b) + calc_strongest_bridge(
-                components, next_port, used | frozenset({i})
-            )
+    @lru_cache(maxsize=None)
+    def strongest(open_port: int, used: int) -> int:
+        max_strength = 0
+
+        for i, next_port, component_strength in ports[open_port]:
+            if used >> i & 1:
+                continue  # Skip components that are already used
+
+            bridge_strength = component_strength + strongest(next_port,
+                                                             used | 1 << i)
             max_strength = max(max_strength, bridge_strength)
 
-    return max_strength
+        return max_strength
+
+    return strongest(open_port, used)
 
 
 def find_longest_bridge(components: List[Tuple[int, int]],
                         open_port: int = 0,
-                        used: frozenset = frozenset()) -> Tuple[int, int]:
+                        used: int = 0) -> Tuple[int, int]:
     """
     Recursively finds the longest possible bridge. If multiple bridges have
     the same length, the strongest one is chosen.
 
+    As in calc_strongest_bridge, the used components are a bitmask and the
+    search is memoized on (open_port, used) and only looks at the
+    components with a matching port.
+
     :param components: List of available components.
     :param open_port: The port value to which the next piece must connect.
-    :param used: A frozenset of used component indices to prevent reuse.
+    :param used: A bitmask of used component indices to prevent reuse.
     :return: (length, strength) of the longest valid bridge.
     """
 
-    max_length = 0
-    max_strength = 0
+    ports = group_by_port(components)
 
-    for i, (a, b) in enumerate(components):
-        if i in used:
-            continue  # Skip already used components
+    @lru_cache(maxsize=None)
+    def longest(open_port: int, used: int) -> Tuple[int, int]:
+        max_length = 0
+        max_strength = 0
 
-        if a == open_port or b == open_port:
-            next_port = b if a == open_port else a  # Determine new open port
-            length, strength = find_longest_bridge(
-                components, next_port, used | frozenset({i})
-            )
+        for i, next_port, component_strength in ports[open_port]:
+            if used >> i & 1:
+                continue  # Skip already used components
+
+            length, strength = longest(next_port, used | 1 << i)
 
             # Update with current component
             length += 1
-            strength += (a + b)
+            strength += component_strength
 
             # Prioritize longer bridges,
             # then stronger ones if lengths are equal
@@ -84,7 +118,9 @@ def find_longest_bridge(components: List[Tuple[int, int]],
                 max_length = length
                 max_strength = strength
 
-    return max_length, max_strength
+        return max_length, max_strength
+
+    return longest(open_port, used)
 
 
 def part_one(data: List[Tuple[int, int]]) -> int:
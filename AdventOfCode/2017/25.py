@@ -2,6 +2,17 @@
 
 import re
 
+import numpy as np
+
+try:
+    from numba import njit
+    HAVE_NUMBA = True
+except ImportError:  # run_machine then steps through a bytearray tape
+    HAVE_NUMBA = False
+
+    def njit(**kwargs):
+        return lambda func: func
+
 
 def read_puzzle_input() -> str:
     """
@@ -70,35 +81,96 @@ def parse_input(data: str) -> tuple:
     return initial_state, steps, states
 
 
-if __name__ == "__main__":
-    # Read and parse the input file
-    data = read_puzzle_input()
-    initial_state, steps, states = parse_input(data)
+def compile_rules(states: dict) -> tuple:
+    """
+    Numbers the states in order and flattens their rules into one list of
+    ints, so the machine can look them up by index instead of by name.
+
+    Args:
+        states (dict): The transition rules from parse_input.
+
+    Returns:
+        tuple: (names (dict), rules (list))
+            - names: A dictionary mapping state names to their numbers.
+            - rules: For state s and current value v, the write value, move
+                     and next state number, at rules[6 * s + 3 * v:][:3].
+    """
+
+    names = {name: number for number, name in enumerate(states)}
+    rules = []
+    for name in states:
+        for value in (0, 1):
+            write_value, direction, next_state = states[name][value]
+            rules += [write_value, direction, names[next_state]]
+    return names, rules
+
+
+def make_tape(steps: int):
+    """
+    Creates a blank tape long enough for the cursor to start in the middle
+    and move one slot per step in either direction without running off
+    (a bytearray when run_machine isn't compiled).
+
+    Args:
+        steps (int): The number of steps the machine will run for.
+
+    Returns:
+        A tape of 2 * steps + 1 zeros.
+    """
+
+    if HAVE_NUMBA:
+        return np.zeros(2 * steps + 1, dtype=np.uint8)
+    return bytearray(2 * steps + 1)
+
+
+@njit(cache=True)
+def run_machine(tape, rules, state: int, steps: int) -> int:
+    """
+    Runs the Turing machine for the given number of steps, starting with
+    the cursor in the middle of the tape, and returns the checksum, which
+    is kept up to date as each value is written.
+
+    Args:
+        tape: A blank tape from make_tape; modified in place.
+        rules: The flat rules from compile_rules (as an int64 array when
+               compiled).
+        state (int): The number of the state to start in.
+        steps (int): The number of steps to execute.
 
-    # Use a set to store positions with value 1, as the default value is 0
-    # Instead of a dictionary, we use a set to track positions holding `1`
-    tape = set()
-    cursor = 0  # The current position of the Turing machine
-    state = initial_state  # The current active state of the machine
+    Returns:
+        int: The number of 1s on the tape after the last step.
+    """
+
+    cursor = steps  # The current position of the Turing machine
+    ones = 0  # The number of 1s on the tape, kept as we go
 
     # Run the Turing machine for the given number of steps
     for _ in range(steps):
-        # Cache transition rules for current state
-        state_rules = states[state]
-        # Check if current position is in the set (1) or not (0)
-        current_value = 1 if cursor in tape else 0
+        # Get the rule for the current state and value
+        current_value = tape[cursor]
+        rule = 6 * state + 3 * current_value
+        write_value = rules[rule]
+
+        # Update the tape based on the rule, and the count of 1s with it
+        tape[cursor] = write_value
+        ones += write_value - current_value
 
-        # Get the rule for the current value
-        write_value, direction, state = state_rules[current_value]
+        # Move the cursor left or right, and on to the next state
+        cursor += rules[rule + 1]
+        state = rules[rule + 2]
 
-        # Update the tape based on the rule
-        if write_value == 1:
-            tape.add(cursor)  # Store position if writing 1
-        else:
-            tape.discard(cursor)  # Remove position if writing 0
+    return ones
 
-        # Move the cursor left or right
-        cursor += direction
 
-    # The checksum is the number of 1s on the tape (size of the set)
-    print(f"Part 1: {len(tape)}")  # Expected output: 5593
+if __name__ == "__main__":
+    # Read and parse the input file
+    data = read_puzzle_input()
+    initial_state, steps, states = parse_input(data)
+    names, rules = compile_rules(states)
+    if HAVE_NUMBA:
+        rules = np.array(rules, dtype=np.int64)
+
+    # The checksum is the number of 1s on the tape
+    checksum = run_machine(make_tape(steps), rules, names[initial_state],
+                           steps)
+    print(f"Part 1: {checksum}")  # Expected output: 5593
@@ -1,5 +1,7 @@
 #!/usr/bin/env python
 
+from itertools import accumulate
+
 
 def read_puzzle_input() -> list:
     with open("01.in", "r") as file:
@@ -11,16 +13,34 @@ def part_one(data: list) -> int:
 
 
 def part_two(data: list) -> int:
-    current_frequency = 0
-    frequencies = {0}
-
-    while True:
-        for change in data:
-            current_frequency += change
-            if current_frequency in frequencies:
-                return current_frequency
-
-            frequencies.add(current_frequency)
+    # Every frequency reached in the first pass through the changes
+    frequencies = list(accumulate(data, initial=0))
+    seen = set()
+    for frequency in frequencies:
+        if frequency in seen:
+            return frequency
+        seen.add(frequency)
+
+    # With no repeat in the first pass, every later pass just shifts the
+    # frequencies of the first by another total. So a frequency is only
+    # ever reached again from one that's a whole number of totals away,
+    # and passing back through a repeat can be found without the loop
+    total = frequencies.pop()
+    classes = {}
+    for i, frequency in enumerate(frequencies):
+        classes.setdefault(frequency % total, []).append((frequency, i))
+
+    # Within a class, each frequency (before it) reaches the next one in
+    # the direction of the total first, after (next - it) // total passes
+    first = None
+    for members in classes.values():
+        members.sort(reverse=total < 0)
+        for (start, i), (repeat, _) in zip(members, members[1:]):
+            reached = (repeat - start) // total * len(data) + i
+            if first is None or reached < first[0]:
+                first = reached, repeat
+
+    return first[1]
 
 
 if __name__ == "__main__":
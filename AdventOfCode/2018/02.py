@@ -55,6 +55,9 @@ def part_two(data: list) -> str:
     position. Returns the common letters of these two IDs (excluding the
     differing character).
 
+    This takes one pass over the IDs per character position, instead of a
+    comparison between every pair of IDs.
+
     Args:
         data (list): List of box ID strings.
 
@@ -62,15 +65,16 @@ def part_two(data: list) -> str:
         str: The common letters of the two matching box IDs.
     """
 
-    for i, id1 in enumerate(data):
-        for id2 in data[i + 1:]:  # Avoid redundant comparisons
-
-            # Count differences directly using sum with a generator
-            diffs = [(c1, c2) for c1, c2 in zip(id1, id2) if c1 != c2]
-
-            # If exactly one character is different, return the common part
-            if len(diffs) == 1:
-                return "".join(c1 for c1, c2 in zip(id1, id2) if c1 == c2)
+    # Two IDs differ only at position k exactly when they're the same with
+    # that position cut out, so look for a repeat among the cut IDs one
+    # position at a time, rather than comparing every pair of IDs
+    for k in range(len(data[0]) if data else 0):
+        seen = set()
+        for box_id in data:
+            common = box_id[:k] + box_id[k + 1:]
+            if common in seen:
+                return common
+            seen.add(common)
 
     return ""  # Return empty string if no matching IDs are found
 
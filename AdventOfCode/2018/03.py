@@ -2,6 +2,11 @@
 
 import re
 
+import numpy as np
+
+# Matches each number in a claim
+NUMBER = re.compile(r'\d+')
+
 
 def read_puzzle_input() -> list:
     """
@@ -20,7 +25,35 @@ def parse_claim(claim):
     Returns: (123, 3, 2, 5, 4)
     """
 
-    return tuple(map(int, re.findall(r'\d+', claim)))
+    return tuple(map(int, NUMBER.findall(claim)))
+
+
+def cover_fabric(claims) -> tuple:
+    """
+    Parses the claims and counts how many of them cover each square inch.
+
+    The fabric is a numpy array just big enough to hold every claim, so
+    each claim is counted with a single add over its rectangle.
+
+    Args:
+        claims (list): List of fabric claim strings.
+
+    Returns:
+        tuple: (parsed, fabric)
+            - parsed: The (id, x, y, w, h) tuple of each claim.
+            - fabric: The number of claims covering each square inch,
+                      indexed by [y, x].
+    """
+
+    parsed = [parse_claim(claim) for claim in claims]
+    width = max((x + w for _, x, _, w, _ in parsed), default=0)
+    height = max((y + h for _, _, y, _, h in parsed), default=0)
+
+    fabric = np.zeros((height, width), dtype=np.uint16)
+    for _, x, y, w, h in parsed:
+        fabric[y:y + h, x:x + w] += 1
+
+    return parsed, fabric
 
 
 def part_one(claims):
@@ -35,15 +68,8 @@ def part_one(claims):
         int: Count of overlapping square inches.
     """
 
-    fabric = {}  # Dictionary to track fabric usage (x, y) -> count
-
-    for claim in claims:
-        _, x, y, w, h = parse_claim(claim)
-        for dx in range(w):
-            for dy in range(h):
-                fabric[(x + dx, y + dy)] = fabric.get((x + dx, y + dy), 0) + 1
-
-    return sum(1 for count in fabric.values() if count > 1)
+    _, fabric = cover_fabric(claims)
+    return int(np.count_nonzero(fabric > 1))
 
 
 def part_two(claims):
@@ -56,27 +82,15 @@ def part_two(claims):
     Returns:
         int: The ID of the non-overlapping claim.
     """
-    fabric = {}  # Dictionary tracking (x, y) -> set of claim IDs
-    all_claims = set()
-
-    # Track claim coverage
-    for claim in claims:
-        claim_id, x, y, w, h = parse_claim(claim)
-        all_claims.add(claim_id)
-        for dx in range(w):
-            for dy in range(h):
-                coord = (x + dx, y + dy)
-                if coord not in fabric:
-                    fabric[coord] = {claim_id}
-                else:
-                    fabric[coord].add(claim_id)
-
-    # Remove overlapping claims
-    for ids in fabric.values():
-        if len(ids) > 1:
-            all_claims.difference_update(ids)
-
-    return all_claims.pop()  # The remaining claim is the non-overlapping one
+
+    parsed, fabric = cover_fabric(claims)
+
+    # A claim overlaps no other if it is the only one on all its squares
+    for claim_id, x, y, w, h in parsed:
+        if (fabric[y:y + h, x:x + w] == 1).all():
+            return claim_id
+
+    return None  # Every claim overlaps another
 
 
 if __name__ == "__main__":
@@ -4,6 +4,12 @@ from typing import List, Dict, Tuple
 import re
 from collections import defaultdict
 
+import numpy as np
+from numpy.typing import NDArray
+
+# Matches a record's timestamp and action
+RECORD = re.compile(r"\[(\d+)-(\d+)-(\d+) (\d+):(\d+)\] (.+)")
+
 
 def read_puzzle_input(filename: str = "04.in") -> List[str]:
     """
@@ -24,7 +30,8 @@ def read_puzzle_input(filename: str = "04.in") -> List[str]:
 
 
 def parse_guard_records(
-        data: List[str]) -> Tuple[Dict[int, int], Dict[int, List[int]]]:
+        data: List[str]
+) -> Tuple[Dict[int, int], Dict[int, NDArray[np.int32]]]:
     """
     Parse and analyze guard sleep records.
 
@@ -38,21 +45,21 @@ def parse_guard_records(
     Returns:
         Tuple containing:
         - sleep_tracker: Dict mapping guard IDs to total sleep time
-        - minute_tracker: Dict mapping guard IDs to sleep frequency per minute
+        - minute_tracker: Dict mapping guard IDs to sleep frequency per minute,
+          as a numpy array so each nap is counted with one slice add
     """
 
     sleep_tracker: Dict[int, int] = defaultdict(int)
-    minute_tracker: Dict[int, List[int]] = defaultdict(lambda: [0] * 60)
+    minute_tracker: Dict[int, NDArray[np.int32]] = defaultdict(
+        lambda: np.zeros(60, dtype=np.int32))
 
     current_guard_id: int | None = None
     sleep_start: int | None = None
 
     for record in data:
-        # Regex to parse timestamp and action
-        match = re.match(
-            r"\[(\d+)-(\d+)-(\d+) (\d+):(\d+)\] (.+)",
-            record.strip()
-        )
+        # Parse the timestamp and action (the action stops short of the
+        # record's newline, so there's no need to strip it first)
+        match = RECORD.match(record)
 
         if not match:
             continue
@@ -61,18 +68,16 @@ def parse_guard_records(
         minute = int(minute)
 
         # Identify guard or track sleep periods
-        if "Guard" in action:
-            match_guard = re.search(r"#(\d+)", action)
-            if match_guard:
-                current_guard_id = int(match_guard.group(1))
+        if action.startswith("Guard"):
+            # "Guard #N begins shift"
+            current_guard_id = int(action.split("#", 1)[1].split()[0])
         elif "falls asleep" in action:
             sleep_start = minute
         elif ("wakes up" in action and
                 current_guard_id is not None and
                 sleep_start is not None):
             # Track sleep time and minute-by-minute sleep frequency
-            for m in range(sleep_start, minute):
-                minute_tracker[current_guard_id][m] += 1
+            minute_tracker[current_guard_id][sleep_start:minute] += 1
             sleep_tracker[current_guard_id] += minute - sleep_start
 
     return sleep_tracker, minute_tracker
@@ -107,9 +112,7 @@ def part_one(data: List[str]) -> int:
     # )
 
     # Find the minute this guard slept most frequently
-    most_sleep_minute = minute_tracker[sleepiest_guard].index(
-        max(minute_tracker[sleepiest_guard])
-    )
+    most_sleep_minute = int(minute_tracker[sleepiest_guard].argmax())
 
     return sleepiest_guard * most_sleep_minute
 
@@ -130,23 +133,17 @@ def part_two(data: List[str]) -> int:
 
     _, minute_tracker = parse_guard_records(data)
 
-    # Find the guard and minute with the highest sleep frequency
-    max_guard: int | None = None
-    max_minute: int | None = None
-    max_count: int = 0
-
-    for guard, minutes in minute_tracker.items():
-        for minute, count in enumerate(minutes):
-            if count > max_count:
-                max_guard = guard
-                max_minute = minute
-                max_count = count
-
-    return (
-        max_guard * max_minute
-        if max_guard is not None and max_minute is not None
-        else 0
-    )
+    if not minute_tracker:
+        return 0
+
+    # Find the guard and minute with the highest sleep frequency, by
+    # stacking every guard's minutes into one array, with a row per guard,
+    # and finding its largest count in one go
+    guards = list(minute_tracker)
+    minutes = np.vstack([minute_tracker[guard] for guard in guards])
+    max_guard, max_minute = divmod(int(minutes.argmax()), 60)
+
+    return guards[max_guard] * max_minute
 
 
 if __name__ == "__main__":
@@ -30,6 +30,10 @@ def react_polymer(polymer: str) -> str:
           letter, different case), remove the last unit
         - Otherwise, append the current unit to the stack
 
+    The units are handled as ASCII byte values, so the reaction test is a
+    single XOR and compare, rather than string comparisons and calls to
+    str.lower().
+
     Example:
     - 'aA' reduces to '' (units annihilate each other)
     - 'abBA' reduces to ''
@@ -43,13 +47,14 @@ def react_polymer(polymer: str) -> str:
     """
 
     stack = []
-    for unit in polymer:
-        # Check if the current unit reacts with the last unit in the stack
-        if stack and stack[-1] != unit and stack[-1].lower() == unit.lower():
+    for unit in polymer.encode():
+        # Check if the current unit reacts with the last unit in the stack:
+        # a letter's two cases differ only in the bit worth 32 in ASCII
+        if stack and stack[-1] ^ unit == 32:
             stack.pop()  # Remove the last unit if it reacts
         else:
             stack.append(unit)  # Otherwise keep the unit
-    return "".join(stack)
+    return bytes(stack).decode()
 
 
 def generate_reduced_polymers(polymer: str) -> Generator[int, None, None]:
@@ -93,6 +98,11 @@ def part_two(data: str) -> int:
     Solve Part 2: Find the shortest possible polymer length
     after removing one letter type.
 
+    Any pair that reacts in the full polymer still reacts once a letter
+    type is taken out (whatever was between them is gone either way), so
+    each letter is removed from the already reduced polymer, which is
+    usually a fraction of the length, rather than from the original.
+
     Args:
         data (str): The input polymer string.
 
@@ -100,7 +110,7 @@ def part_two(data: str) -> int:
         int: Length of the shortest possible polymer.
     """
 
-    return min(generate_reduced_polymers(data))
+    return min(generate_reduced_polymers(react_polymer(data)))
 
 
 if __name__ == "__main__":
@@ -1,8 +1,9 @@
 #!/usr/bin/env python3
 
-from collections import Counter, deque
 from typing import List, Tuple
 
+import numpy as np
+
 
 def read_puzzle_input() -> List[Tuple[int, ...]]:
     """
@@ -23,22 +24,6 @@ def read_puzzle_input() -> List[Tuple[int, ...]]:
         ]
 
 
-def calculate_manhattan_distance(p1: Tuple[int, int],
-                                 p2: Tuple[int, int]) -> int:
-    """
-    Calculate Manhattan (city block) distance between two points.
-
-    Args:
-        p1: First point as (x, y) tuple
-        p2: Second point as (x, y) tuple
-
-    Returns:
-        Manhattan distance between the points
-    """
-
-    return abs(p1[0] - p2[0]) + abs(p1[1] - p2[1])
-
-
 def find_largest_finite_area(points: List[Tuple[int, int]]) -> int:
     """
     Find the largest area that is not infinite in a coordinate grid.
@@ -49,6 +34,9 @@ def find_largest_finite_area(points: List[Tuple[int, int]]) -> int:
     3. Exclude points with areas touching grid boundaries
     4. Calculate area sizes for remaining points
 
+    Every step runs over the whole grid at once with numpy, rather than
+    cell by cell.
+
     Args:
         points: List of coordinate points
 
@@ -56,46 +44,34 @@ def find_largest_finite_area(points: List[Tuple[int, int]]) -> int:
         Size of the largest finite area
     """
 
-    # Compute grid boundaries
-    min_x = min(x for x, _ in points)
-    max_x = max(x for x, _ in points)
-    min_y = min(y for _, y in points)
-    max_y = max(y for _, y in points)
-
-    # Track point areas and infinite regions
-    area_sizes = Counter()
-    infinite_points = set()
-
-    # Iterate through every cell in the grid
-    for x in range(min_x, max_x + 1):
-        for y in range(min_y, max_y + 1):
-            # Find closest point to current cell
-            distances = [
-                calculate_manhattan_distance((x, y), point) for point in points
-            ]
-            min_distance = min(distances)
+    xs = np.array([x for x, _ in points])
+    ys = np.array([y for _, y in points])
 
-            # Check for unique closest point
-            closest_points = [
-                points[i] for i, dist in enumerate(distances)
-                if dist == min_distance
-            ]
+    # Distance from every grid cell to every point at once, as a
+    # (height, width, points) array, with the grid spanning the points
+    grid_xs = np.arange(xs.min(), xs.max() + 1)
+    grid_ys = np.arange(ys.min(), ys.max() + 1)
+    distances = (np.abs(grid_xs[None, :, None] - xs) +
+                 np.abs(grid_ys[:, None, None] - ys))
 
-            # If multiple points are equidistant, skip
-            if len(closest_points) > 1:
-                continue
+    # Find closest point to each cell, and whether it's the only one that
+    # close (if not, it's a tie)
+    closest = distances.argmin(axis=2)
+    min_distance = distances.min(axis=2, keepdims=True)
+    unique = np.count_nonzero(distances == min_distance, axis=2) == 1
 
-            closest_point = closest_points[0]
+    # Mark infinite areas (points closest to any cell on the grid's edge)
+    edges = np.concatenate((closest[0][unique[0]],
+                            closest[-1][unique[-1]],
+                            closest[:, 0][unique[:, 0]],
+                            closest[:, -1][unique[:, -1]]))
 
-            # Mark infinite areas (points touching grid boundaries)
-            if x in (min_x, max_x) or y in (min_y, max_y):
-                infinite_points.add(closest_point)
+    # Count the cells closest to each point, ignoring ties, and drop the
+    # infinite areas
+    area_sizes = np.bincount(closest[unique], minlength=len(points))
+    area_sizes[edges] = 0
 
-            # Count area for non-infinite points
-            if closest_point not in infinite_points:
-                area_sizes[closest_point] += 1
-
-    return max(area_sizes.values(), default=0)
+    return int(area_sizes.max(initial=0))
 
 
 def find_safe_region_size(points: List[Tuple[int, int]],
@@ -104,8 +80,11 @@ def find_safe_region_size(points: List[Tuple[int, int]],
     Find the size of a region where the total distance to all points is less
     than a threshold.
 
-    Uses a breadth-first search (BFS) approach to explore the safe region
-    efficiently.
+    The total Manhattan distance splits into a sum over x plus a sum over
+    y, so each is worked out once per column and once per row, and a cell
+    is safe when its column's total and its row's total add up to less
+    than the threshold. Counting those pairs is one binary search per
+    column over the sorted row totals.
 
     Args:
         points: List of coordinate points
@@ -115,35 +94,23 @@ def find_safe_region_size(points: List[Tuple[int, int]],
         Number of points within the safe region
     """
 
-    # Estimate search center based on point mean coordinates
-    start_x = sum(x for x, _ in points) // len(points)
-    start_y = sum(y for _, y in points) // len(points)
-
-    # BFS to explore safe region
-    queue = deque([(start_x, start_y)])
-    visited = {(start_x, start_y)}
-    safe_region_size = 0
-
-    while queue:
-        x, y = queue.popleft()
-
-        # Calculate total distance to all points
-        total_distance = sum(
-            calculate_manhattan_distance((x, y), point) for point in points
-        )
+    xs = np.array([x for x, _ in points])
+    ys = np.array([y for _, y in points])
 
-        # Count point if within safe region
-        if total_distance < max_total_distance:
-            safe_region_size += 1
+    # Beyond the points, every step away adds one to the distance to each
+    # of them, so the safe region can't reach more than this far out
+    reach = max_total_distance // len(points) + 1
 
-            # Explore adjacent unvisited points
-            for dx, dy in [(-1, 0), (1, 0), (0, -1), (0, 1)]:
-                next_point = (x + dx, y + dy)
-                if next_point not in visited:
-                    visited.add(next_point)
-                    queue.append(next_point)
+    # Total distance along each axis, from every column and every row
+    # that could be in the safe region
+    columns = np.arange(xs.min() - reach, xs.max() + reach + 1)
+    rows = np.arange(ys.min() - reach, ys.max() + reach + 1)
+    column_totals = np.abs(columns[:, None] - xs).sum(axis=1)
+    row_totals = np.sort(np.abs(rows[:, None] - ys).sum(axis=1))
 
-    return safe_region_size
+    # For each column, count the rows whose total keeps the cell safe
+    safe_rows = np.searchsorted(row_totals, max_total_distance - column_totals)
+    return int(safe_rows.sum())
 
 
 def part_one(data: list) -> int: